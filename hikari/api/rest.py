@@ -135,6 +135,17 @@ def token_type(self) -> str | applications.TokenType | None:
     async def close(self) -> None:
         """Close the client session."""
 
+    @abc.abstractmethod
+    def clear_response_cache(self) -> None:
+        """Clear the cached responses used by some endpoints.
+
+        The responses of [`hikari.api.rest.RESTClient.fetch_gateway_url`][],
+        [`hikari.api.rest.RESTClient.fetch_voice_regions`][] and
+        [`hikari.api.rest.RESTClient.fetch_available_sticker_packs`][] are
+        cached for up to an hour, as they rarely change. Calling this forces
+        the next call to each of them to make a new request.
+        """
+
     @abc.abstractmethod
     async def fetch_channel(
         self, channel: snowflakes.SnowflakeishOr[channels_.PartialChannel]
@@ -1557,8 +1568,10 @@ async def edit_message(
         Raises
         ------
         ValueError
-            If both `attachment` and `attachments`, `component` and `components`
-            or `embed` and `embeds` are specified.
+            If more than 100 unique objects/entities are passed for
+            `role_mentions` or `user_mentions` or if both `attachment` and
+            `attachments`, `component` and `components` or `embed` and `embeds`
+            are specified.
         hikari.errors.BadRequestError
             This may be raised in several discrete situations, such as messages
             being empty with no embeds; messages with more than 2000 characters
@@ -2313,7 +2326,9 @@ async def execute_webhook(
         username: undefined.UndefinedOr[str] = undefined.UNDEFINED,
         avatar_url: undefined.UndefinedType | str | files.URL = undefined.UNDEFINED,
         attachment: undefined.UndefinedOr[files.Resourceish] = undefined.UNDEFINED,
-        attachments: undefined.UndefinedOr[typing.Sequence[files.Resourceish]] = undefined.UNDEFINED,
+        attachments: undefined.UndefinedOr[
+            typing.Iterable[files.Resourceish] | typing.AsyncIterable[files.Resourceish]
+        ] = undefined.UNDEFINED,
         component: undefined.UndefinedOr[special_endpoints.ComponentBuilder] = undefined.UNDEFINED,
         components: undefined.UndefinedOr[typing.Sequence[special_endpoints.ComponentBuilder]] = undefined.UNDEFINED,
         embed: undefined.UndefinedOr[embeds_.Embed] = undefined.UNDEFINED,
@@ -2406,6 +2421,11 @@ async def execute_webhook(
         attachments
             If provided, the message attachments. These can be resources, or
             strings consisting of paths on your computer or URLs.
+
+            This may be any iterable or async iterable of attachments. Async
+            iterables are consumed in full before the request is made, as
+            the multipart body must know all of its parts up front. Any error
+            raised while consuming one is propagated and no request is made.
         component
             If provided, builder object of the component to include in this message.
         components
@@ -2529,7 +2549,8 @@ async def edit_webhook_message(
         thread: undefined.UndefinedType | snowflakes.SnowflakeishOr[channels_.GuildThreadChannel] = undefined.UNDEFINED,
         attachment: undefined.UndefinedNoneOr[files.Resourceish | messages_.Attachment] = undefined.UNDEFINED,
         attachments: undefined.UndefinedNoneOr[
-            typing.Sequence[files.Resourceish | messages_.Attachment]
+            typing.Iterable[files.Resourceish | messages_.Attachment]
+            | typing.AsyncIterable[files.Resourceish | messages_.Attachment]
         ] = undefined.UNDEFINED,
         component: undefined.UndefinedNoneOr[special_endpoints.ComponentBuilder] = undefined.UNDEFINED,
         components: undefined.UndefinedNoneOr[
@@ -2602,6 +2623,11 @@ async def edit_webhook_message(
             present, are not changed. If this is [`None`][], then the
             attachments is removed, if present. Otherwise, the new attachments
             that were provided will be attached.
+
+            This may be any iterable or async iterable of attachments. Async
+            iterables are consumed in full before the request is made, as
+            the multipart body must know all of its parts up front. Any error
+            raised while consuming one is propagated and no request is made.
         component
             If provided, builder object of the component to set for this message.
             This component will replace any previously set components and passing
@@ -2654,8 +2680,10 @@ async def edit_webhook_message(
         Raises
         ------
         ValueError
-            If both `attachment` and `attachments`, `component` and `components`
-            or `embed` and `embeds` are specified.
+            If more than 100 unique objects/entities are passed for
+            `role_mentions` or `user_mentions` or if both `attachment` and
+            `attachments`, `component` and `components` or `embed` and `embeds`
+            are specified.
         hikari.errors.BadRequestError
             This may be raised in several discrete situations, such as messages
             being empty with no attachments or embeds; messages with more than
@@ -2715,6 +2743,54 @@ async def delete_webhook_message(
             If an internal error occurs on Discord while handling the request.
         """
 
+    @abc.abstractmethod
+    async def delete_webhook_messages(
+        self,
+        # MyPy might not say this but SnowflakeishOr[ExecutableWebhook] isn't valid as ExecutableWebhook isn't Unique
+        webhook: webhooks.ExecutableWebhook | snowflakes.Snowflakeish,
+        token: str,
+        messages: typing.Iterable[snowflakes.SnowflakeishOr[messages_.Message]]
+        | typing.AsyncIterable[snowflakes.SnowflakeishOr[messages_.Message]],
+        *,
+        thread: undefined.UndefinedType | snowflakes.SnowflakeishOr[channels_.GuildThreadChannel] = undefined.UNDEFINED,
+    ) -> None:
+        """Delete multiple messages sent by a webhook.
+
+        !!! note
+            Discord does not provide a bulk-delete endpoint for webhooks, so
+            the messages are deleted one-after-the-other using the same
+            connection and rate limit bucket. Messages which no longer exist
+            are treated as deleted, to match the behaviour of `delete_messages`.
+
+        !!! warning
+            This endpoint is not atomic. If an error occurs midway through,
+            you will **not** be able to revert any changes made up to this point.
+
+        Parameters
+        ----------
+        webhook
+            The webhook to execute. This may be the object
+            or the ID of an existing webhook.
+        token
+            The webhook token.
+        messages
+            An iterable (sync or async) of the objects and/or IDs of existing
+            messages to delete.
+        thread
+            If provided then the messages will be deleted from the target thread
+            within the webhook's channel, otherwise they will be deleted from
+            the webhook's target channel.
+
+            This is required when trying to delete thread messages.
+
+        Raises
+        ------
+        hikari.errors.BulkDeleteError
+            An error containing the messages successfully deleted. The
+            [`BaseException.__cause__`][] of the exception will be the
+            original error that terminated this process.
+        """
+
     @abc.abstractmethod
     async def fetch_gateway_url(self) -> str:
         """Fetch the gateway url.
@@ -2722,6 +2798,11 @@ async def fetch_gateway_url(self) -> str:
         !!! note
             This endpoint does not require any valid authorization.
 
+        !!! note
+            The response is cached for up to an hour, so this may return a
+            previously fetched url. Use [`hikari.api.rest.RESTClient.clear_response_cache`][]
+            to force a new request.
+
         Raises
         ------
         hikari.errors.RateLimitTooLongError
@@ -2903,6 +2984,7 @@ def fetch_my_guilds(
         *,
         newest_first: bool = False,
         start_at: undefined.UndefinedOr[snowflakes.SearchableSnowflakeishOr[guilds.PartialGuild]] = undefined.UNDEFINED,
+        prefetch: bool = False,
     ) -> iterators.LazyIterator[applications.OwnGuild]:
         """Fetch the token's associated guilds.
 
@@ -2922,6 +3004,9 @@ def fetch_my_guilds(
             a datetime object, it will be transformed into a snowflake. This
             may also be a guild object. In this case, the
             date the object was first created will be used.
+        prefetch
+            Whether to request the next page of guilds while the current
+            one is being iterated over.
 
         Returns
         -------
@@ -3080,6 +3165,40 @@ async def create_dm_channel(self, user: snowflakes.SnowflakeishOr[users.PartialU
             If an internal error occurs on Discord while handling the request.
         """
 
+    @abc.abstractmethod
+    async def create_dm_channels(
+        self, users: typing.Iterable[snowflakes.SnowflakeishOr[users.PartialUser]], /
+    ) -> typing.Sequence[channels_.DMChannel]:
+        """Create DM channels with multiple users.
+
+        This is equivalent to calling `create_dm_channel` for each user, but
+        the requests are made concurrently rather than one after the other.
+
+        Parameters
+        ----------
+        users
+            The users to create DM channels with. These may be the
+            objects or the IDs of existing users.
+
+        Returns
+        -------
+        typing.Sequence[hikari.channels.DMChannel]
+            The created DM channels, in the same order as `users`.
+
+        Raises
+        ------
+        hikari.errors.BadRequestError
+            If any of the users are not found. Any requests still in
+            progress when this happens are cancelled.
+        hikari.errors.UnauthorizedError
+            If you are unauthorized to make the request (invalid/missing token).
+        hikari.errors.RateLimitTooLongError
+            Raised in the event that a rate limit occurs that is
+            longer than `max_rate_limit` when making a request.
+        hikari.errors.InternalServerError
+            If an internal error occurs on Discord while handling the request.
+        """
+
     # THIS IS AN OAUTH2 FLOW BUT CAN ALSO BE USED BY BOTS
     @abc.abstractmethod
     async def fetch_application(self) -> applications.Application:
@@ -3433,6 +3552,11 @@ async def add_user_to_guild(
     async def fetch_voice_regions(self) -> typing.Sequence[voices.VoiceRegion]:
         """Fetch available voice regions.
 
+        !!! note
+            The response is cached for up to an hour, so this may return
+            previously fetched regions. Use [`hikari.api.rest.RESTClient.clear_response_cache`][]
+            to force a new request.
+
         Returns
         -------
         typing.Sequence[hikari.voices.VoiceRegion]
@@ -3485,6 +3609,7 @@ def fetch_audit_log(
         before: undefined.UndefinedOr[snowflakes.SearchableSnowflakeishOr[snowflakes.Unique]] = undefined.UNDEFINED,
         user: undefined.UndefinedOr[snowflakes.SnowflakeishOr[users.PartialUser]] = undefined.UNDEFINED,
         event_type: undefined.UndefinedOr[audit_logs.AuditLogEventType | int] = undefined.UNDEFINED,
+        prefetch: bool = False,
     ) -> iterators.LazyIterator[audit_logs.AuditLog]:
         """Fetch pages of the guild's audit log.
 
@@ -3509,6 +3634,9 @@ def fetch_audit_log(
             If provided, the user to filter for.
         event_type
             If provided, the event type to filter for.
+        prefetch
+            Whether to request the next audit log page while the current
+            one is being processed.
 
         Returns
         -------
@@ -3931,6 +4059,11 @@ async def delete_application_emoji(
     async def fetch_available_sticker_packs(self) -> typing.Sequence[stickers_.StickerPack]:
         """Fetch the available sticker packs.
 
+        !!! note
+            The response is cached for up to an hour, so this may return
+            previously fetched packs. Use [`hikari.api.rest.RESTClient.clear_response_cache`][]
+            to force a new request.
+
         Returns
         -------
         typing.Sequence[hikari.stickers.StickerPack]
@@ -5312,6 +5445,9 @@ async def create_forum_post(  # noqa: PLR0913
 
         Raises
         ------
+        ValueError
+            If more than 100 unique objects/entities are passed for
+            `role_mentions` or `user_mentions`.
         hikari.errors.BadRequestError
             If any of the fields that are passed have an invalid value.
         hikari.errors.ForbiddenError
@@ -5385,6 +5521,51 @@ async def add_thread_member(
             If an internal error occurs on Discord while handling the request.
         """
 
+    @abc.abstractmethod
+    async def add_thread_members(
+        self,
+        channel: snowflakes.SnowflakeishOr[channels_.GuildThreadChannel],
+        users: typing.Iterable[snowflakes.SnowflakeishOr[users.PartialUser]],
+        /,
+        *,
+        concurrency: int = 64,
+    ) -> None:
+        """Add multiple users to a thread channel.
+
+        This is equivalent to calling `add_thread_member` for each user, but
+        up to `concurrency` requests are made at once rather than one after
+        the other. Duplicate users are only added once. If any request fails,
+        the requests still in progress are cancelled, and any users
+        already added by then stay in the thread.
+
+        Parameters
+        ----------
+        channel
+            Object or ID of the thread channel to add the members to.
+        users
+            Objects or IDs of the users to add to the thread.
+        concurrency
+            The maximum number of requests to have in flight at once.
+
+        Raises
+        ------
+        ValueError
+            If `concurrency` is less than 1.
+        hikari.errors.BadRequestError
+            If any of the fields that are passed have an invalid value.
+        hikari.errors.ForbiddenError
+            If you cannot add users to this thread.
+        hikari.errors.NotFoundError
+            If the thread channel doesn't exist.
+        hikari.errors.UnauthorizedError
+            If you are unauthorized to make the request (invalid/missing token).
+        hikari.errors.RateLimitTooLongError
+            Raised in the event that a rate limit occurs that is
+            longer than `max_rate_limit` when making a request.
+        hikari.errors.InternalServerError
+            If an internal error occurs on Discord while handling the request.
+        """
+
     @abc.abstractmethod
     async def leave_thread(self, channel: snowflakes.SnowflakeishOr[channels_.GuildThreadChannel], /) -> None:
         """Leave a thread channel.
@@ -5442,6 +5623,51 @@ async def remove_thread_member(
             If an internal error occurs on Discord while handling the request.
         """
 
+    @abc.abstractmethod
+    async def remove_thread_members(
+        self,
+        channel: snowflakes.SnowflakeishOr[channels_.GuildThreadChannel],
+        users: typing.Iterable[snowflakes.SnowflakeishOr[users.PartialUser]],
+        /,
+        *,
+        concurrency: int = 64,
+    ) -> None:
+        """Remove multiple users from a thread.
+
+        This is equivalent to calling `remove_thread_member` for each user, but
+        up to `concurrency` requests are made at once rather than one after
+        the other. Duplicate users are only removed once. If any request fails,
+        the requests still in progress are cancelled, and any users
+        already removed by then stay out of the thread.
+
+        Parameters
+        ----------
+        channel
+            Object or ID of the thread channel to remove the members from.
+        users
+            Objects or IDs of the users to remove from the thread.
+        concurrency
+            The maximum number of requests to have in flight at once.
+
+        Raises
+        ------
+        ValueError
+            If `concurrency` is less than 1.
+        hikari.errors.BadRequestError
+            If any of the fields that are passed have an invalid value.
+        hikari.errors.ForbiddenError
+            If you cannot remove users from this thread.
+        hikari.errors.NotFoundError
+            If the thread channel or any of the members don't exist.
+        hikari.errors.UnauthorizedError
+            If you are unauthorized to make the request (invalid/missing token).
+        hikari.errors.RateLimitTooLongError
+            Raised in the event that a rate limit occurs that is
+            longer than `max_rate_limit` when making a request.
+        hikari.errors.InternalServerError
+            If an internal error occurs on Discord while handling the request.
+        """
+
     @abc.abstractmethod
     async def fetch_thread_member(
         self,
@@ -5553,6 +5779,7 @@ def fetch_public_archived_threads(
         /,
         *,
         before: undefined.UndefinedOr[datetime.datetime] = undefined.UNDEFINED,
+        prefetch: bool = False,
     ) -> iterators.LazyIterator[channels_.GuildNewsThread | channels_.GuildPublicThread]:
         """Fetch a channel's public archived threads.
 
@@ -5569,6 +5796,9 @@ def fetch_public_archived_threads(
             The date to fetch threads before.
 
             This is based on the thread's `archive_timestamp` field.
+        prefetch
+            Whether to request the next page of threads while the current
+            one is being iterated over.
 
         Returns
         -------
@@ -5602,6 +5832,7 @@ def fetch_private_archived_threads(
         /,
         *,
         before: undefined.UndefinedOr[datetime.datetime] = undefined.UNDEFINED,
+        prefetch: bool = False,
     ) -> iterators.LazyIterator[channels_.GuildPrivateThread]:
         """Fetch a channel's private archived threads.
 
@@ -5618,6 +5849,9 @@ def fetch_private_archived_threads(
             The date to fetch threads before.
 
             This is based on the thread's `archive_timestamp` field.
+        prefetch
+            Whether to request the next page of threads while the current
+            one is being iterated over.
 
         Returns
         -------
@@ -5653,6 +5887,7 @@ def fetch_joined_private_archived_threads(
         before: undefined.UndefinedOr[
             snowflakes.SearchableSnowflakeishOr[channels_.GuildThreadChannel]
         ] = undefined.UNDEFINED,
+        prefetch: bool = False,
     ) -> iterators.LazyIterator[channels_.GuildPrivateThread]:
         """Fetch the private archived threads you have joined in a channel.
 
@@ -5668,6 +5903,9 @@ def fetch_joined_private_archived_threads(
         before
             If provided, fetch joined threads before this snowflake. If you
             provide a datetime object, it will be transformed into a snowflake.
+        prefetch
+            Whether to request the next page of threads while the current
+            one is being iterated over.
 
         Returns
         -------
@@ -5777,6 +6015,54 @@ async def fetch_member(
             If an internal error occurs on Discord while handling the request.
         """
 
+    @abc.abstractmethod
+    async def fetch_members_bulk(
+        self,
+        guild: snowflakes.SnowflakeishOr[guilds.PartialGuild],
+        users: typing.Iterable[snowflakes.SnowflakeishOr[users.PartialUser]],
+        *,
+        concurrency: int = 64,
+    ) -> typing.Mapping[snowflakes.Snowflake, guilds.Member]:
+        """Fetch multiple guild members.
+
+        This is equivalent to calling `fetch_member` for each user, but
+        up to `concurrency` requests are made at once rather than one after
+        the other. Duplicate users are only fetched once. Users which are not
+        in the guild or do not exist are skipped. If any other request fails,
+        the requests still in progress are cancelled.
+
+        Parameters
+        ----------
+        guild
+            The guild to get the members from. This may be the
+            object or the ID of an existing guild.
+        users
+            The users to get the members for. This may be the
+            objects or the IDs of existing users.
+        concurrency
+            The maximum number of requests to have in flight at once.
+
+        Returns
+        -------
+        typing.Mapping[hikari.snowflakes.Snowflake, hikari.guilds.Member]
+            Mapping of user IDs to the requested members. Users that could
+            not be found in the guild are left out.
+
+        Raises
+        ------
+        ValueError
+            If `concurrency` is less than 1.
+        hikari.errors.UnauthorizedError
+            If you are unauthorized to make the request (invalid/missing token).
+        hikari.errors.NotFoundError
+            If the guild is not found.
+        hikari.errors.RateLimitTooLongError
+            Raised in the event that a rate limit occurs that is
+            longer than `max_rate_limit` when making a request.
+        hikari.errors.InternalServerError
+            If an internal error occurs on Discord while handling the request.
+        """
+
     @abc.abstractmethod
     def fetch_members(
         self,
@@ -5784,6 +6070,7 @@ def fetch_members(
         *,
         after: undefined.UndefinedOr[snowflakes.SnowflakeishOr[users.PartialUser]] = undefined.UNDEFINED,
         limit: undefined.UndefinedOr[int] = undefined.UNDEFINED,
+        prefetch: bool = False,
     ) -> iterators.LazyIterator[guilds.Member]:
         """Fetch the members from a guild.
 
@@ -5811,6 +6098,9 @@ def fetch_members(
             provide a datetime object, it will be transformed into a snowflake.
         limit
             The maximum number of members to fetch.
+        prefetch
+            Whether to request the next page of members while the current
+            one is being iterated over.
 
         Returns
         -------
@@ -6109,6 +6399,70 @@ async def remove_role_from_member(
             If an internal error occurs on Discord while handling the request.
         """
 
+    @abc.abstractmethod
+    async def set_member_roles(
+        self,
+        guild: snowflakes.SnowflakeishOr[guilds.PartialGuild],
+        user: snowflakes.SnowflakeishOr[users.PartialUser],
+        *,
+        add: snowflakes.SnowflakeishSequence[guilds.PartialRole] = (),
+        remove: snowflakes.SnowflakeishSequence[guilds.PartialRole] = (),
+        reason: undefined.UndefinedOr[str] = undefined.UNDEFINED,
+    ) -> guilds.Member:
+        """Add and remove multiple roles from a member at once.
+
+        This fetches the member's current roles and then edits them in a
+        single request, so it costs at most 2 requests no matter how many
+        roles are changed, rather than one request per role like
+        [`hikari.api.rest.RESTClient.add_role_to_member`][] and
+        [`hikari.api.rest.RESTClient.remove_role_from_member`][]. If the
+        member's roles would be left unchanged, the edit request is skipped.
+
+        !!! warning
+            As the member's roles are read before being edited, any role changes
+            made to the member between the two requests will be overwritten.
+
+        Parameters
+        ----------
+        guild
+            The guild where the member is in. This may be the
+            object or the ID of an existing guild.
+        user
+            The user to edit the roles of. This may be the
+            object or the ID of an existing user.
+        add
+            The roles to add to the member. This may be the objects or the
+            IDs of existing roles.
+        remove
+            The roles to remove from the member. This may be the objects or
+            the IDs of existing roles. If a role is in both `add` and `remove`,
+            it will be removed.
+        reason
+            If provided, the reason that will be recorded in the audit logs.
+            Maximum of 512 characters.
+
+        Returns
+        -------
+        hikari.guilds.Member
+            Object of the member with its updated roles.
+
+        Raises
+        ------
+        hikari.errors.BadRequestError
+            If any of the roles passed have an invalid value.
+        hikari.errors.ForbiddenError
+            If you are missing the [`hikari.permissions.Permissions.MANAGE_ROLES`][] permission.
+        hikari.errors.UnauthorizedError
+            If you are unauthorized to make the request (invalid/missing token).
+        hikari.errors.NotFoundError
+            If the guild, user or roles are not found.
+        hikari.errors.RateLimitTooLongError
+            Raised in the event that a rate limit occurs that is
+            longer than `max_rate_limit` when making a request.
+        hikari.errors.InternalServerError
+            If an internal error occurs on Discord while handling the request.
+        """
+
     @abc.abstractmethod
     async def kick_user(
         self,
@@ -6302,6 +6656,7 @@ def fetch_bans(
         *,
         newest_first: bool = False,
         start_at: undefined.UndefinedOr[snowflakes.SearchableSnowflakeishOr[users.PartialUser]] = undefined.UNDEFINED,
+        prefetch: bool = False,
     ) -> iterators.LazyIterator[guilds.GuildBan]:
         """Fetch the bans of a guild.
 
@@ -6322,6 +6677,9 @@ def fetch_bans(
             a datetime object, it will be transformed into a snowflake. This
             may also be a scheduled event object object. In this case, the
             date the object was first created will be used.
+        prefetch
+            Whether to request the next page of bans while the current
+            one is being iterated over.
 
         Returns
         -------
@@ -8223,8 +8581,10 @@ async def edit_interaction_response(
         Raises
         ------
         ValueError
-            If both `attachment` and `attachments`, `component` and `components`
-            or `embed` and `embeds` are specified.
+            If more than 100 unique objects/entities are passed for
+            `role_mentions` or `user_mentions` or if both `attachment` and
+            `attachments`, `component` and `components` or `embed` and `embeds`
+            are specified.
         hikari.errors.BadRequestError
             This may be raised in several discrete situations, such as messages
             being empty with no attachments or embeds; messages with more than
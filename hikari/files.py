@@ -71,6 +71,7 @@
     import typing_extensions  # noqa: TC004
 
 _MAGIC: typing.Final[int] = 50 * 1024
+_MIMETYPE_HEADER_SIZE: typing.Final[int] = 16
 SPOILER_TAG: typing.Final[str] = "SPOILER_"
 
 ReaderImplT = typing.TypeVar("ReaderImplT", bound="AsyncReader")
@@ -323,15 +324,19 @@ def to_data_uri(data: bytes, mimetype: str | None) -> str:
     str
         A data URI string.
     """
+    b64 = base64.b64encode(data).decode()
+    return f"data:{_ensure_mimetype(data, mimetype)};base64,{b64}"
+
+
+def _ensure_mimetype(header: bytes, mimetype: str | None) -> str:
     if mimetype is None:
-        mimetype = guess_mimetype_from_data(data)
+        mimetype = guess_mimetype_from_data(header)
 
         if mimetype is None:
             msg = "Cannot infer mimetype from input data, specify it manually."
             raise TypeError(msg)
 
-    b64 = base64.b64encode(data).decode()
-    return f"data:{mimetype};base64,{b64}"
+    return mimetype
 
 
 @attrs.define(weakref_slot=False)
@@ -351,9 +356,25 @@ class AsyncReader(typing.AsyncIterable[bytes], abc.ABC):
     async def data_uri(self) -> str:
         """Fetch the data URI.
 
-        This reads the entire resource.
+        This reads the entire resource, encoding it as each chunk is read.
         """
-        return to_data_uri(await self.read(), self.mimetype)
+        header = bytearray()
+        encoded = bytearray()
+        remainder = b""
+        async for chunk in self:
+            if len(header) < _MIMETYPE_HEADER_SIZE:
+                header.extend(chunk[: _MIMETYPE_HEADER_SIZE - len(header)])
+
+            data = remainder + chunk if remainder else chunk
+            # Only whole groups of 3 bytes can be encoded without adding padding mid-way.
+            split = len(data) - len(data) % 3
+            encoded += base64.b64encode(memoryview(data)[:split])
+            remainder = data[split:]
+
+        encoded += base64.b64encode(remainder)
+        # Prepending the header in place avoids another copy of the encoded data.
+        encoded[:0] = f"data:{_ensure_mimetype(bytes(header), self.mimetype)};base64,".encode()
+        return encoded.decode()
 
     async def read(self) -> bytes:
         """Read the rest of the resource and return it in a [`bytes`][] object."""
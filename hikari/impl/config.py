@@ -218,6 +218,12 @@ class HTTPSettings(config.HTTPSettings):
     issues present when using Microsoft Windows. If you are sure you know
     what you are doing, you may instead set this to [`False`][] to disable this
     behavior internally.
+
+    !!! note
+        While this is enabled, connections are closed once each request
+        completes rather than being kept alive for reuse, meaning that every
+        request has to open a new connection. Disabling it allows
+        `keepalive_timeout` to take effect.
     """
 
     max_redirects: int | None = attrs.field(default=10)
@@ -248,6 +254,40 @@ class HTTPSettings(config.HTTPSettings):
     The default is to not have any limit.
     """
 
+    connection_limit_per_host: int = attrs.field(default=0)
+    """The maximum number of concurrent connections to allow to a single host per connector.
+
+    If `0`, then there will be no limit.
+
+    The default is to not have any limit.
+    """
+
+    dns_cache_ttl: int | None = attrs.field(default=10)
+    """How long, in seconds, to cache resolved host addresses for.
+
+    If [`None`][], addresses are cached for the lifetime of the connector,
+    which effectively pins the addresses resolved first.
+
+    The default is `10` seconds.
+
+    !!! note
+        This only applies to connectors that use DNS caching, such as the
+        one used for the REST API. Gateway connections always resolve
+        the host again.
+    """
+
+    keepalive_timeout: float = attrs.field(default=15.0)
+    """How long, in seconds, to keep idle connections open to be reused by later requests.
+
+    The default is `15` seconds.
+
+    !!! note
+        This is ignored while `force_close_transports` is [`True`][] (the
+        default), as connections are then closed after every request and
+        never kept alive. Set `force_close_transports` to [`False`][] to
+        make use of this.
+    """
+
     @max_redirects.validator
     def _(self, _: attrs.Attribute[int | None], value: object) -> None:
         # This error won't occur until some time in the future where it will be annoying to
@@ -25,9 +25,7 @@
 __all__: typing.Sequence[str] = ("EventManagerImpl",)
 
 import asyncio
-import base64
 import logging
-import random
 import typing
 
 from hikari import errors
@@ -70,13 +68,6 @@
 _LOGGER: typing.Final[logging.Logger] = logging.getLogger("hikari.event_manager")
 
 
-def _fixed_size_nonce() -> str:
-    # This generates nonces of length 28 for use in member chunking.
-    head = time.time_ns().to_bytes(8, "big")
-    tail = random.getrandbits(92).to_bytes(12, "big")
-    return base64.b64encode(head + tail).decode("ascii")
-
-
 async def _request_guild_members(
     shard: gateway_shard.GatewayShard,
     guild: snowflakes.SnowflakeishOr[guilds.PartialGuild],
@@ -404,7 +395,7 @@ def on_guild_create(  # noqa: C901, PLR0912, PLR0915 - Function too complex, too
                 or self._enabled_for_event(shard_events.MemberChunkEvent)
             )
         ):
-            nonce = f"{shard.id}.{_fixed_size_nonce()}"
+            nonce = f"{shard.id}.{time.fixed_size_nonce()}"
 
             if event:
                 event.chunk_nonce = nonce
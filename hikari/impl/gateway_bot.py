@@ -39,6 +39,7 @@
 from hikari import snowflakes
 from hikari import traits
 from hikari import undefined
+from hikari.events import shard_events
 from hikari.impl import cache as cache_impl
 from hikari.impl import config as config_impl
 from hikari.impl import entity_factory as entity_factory_impl
@@ -1319,6 +1320,157 @@ async def request_guild_members(
             guild=guild, include_presences=include_presences, query=query, limit=limit, users=users, nonce=nonce
         )
 
+    async def fetch_members_via_gateway(
+        self,
+        guild: snowflakes.SnowflakeishOr[guilds.PartialGuild],
+        *,
+        query: str = "",
+        limit: int = 0,
+        users: undefined.UndefinedOr[snowflakes.SnowflakeishSequence[users_.User]] = undefined.UNDEFINED,
+        timeout: float | None = 10,
+    ) -> typing.AsyncIterator[typing.Sequence[guilds.Member]]:
+        """Fetch the members of a guild through the gateway.
+
+        This requests the members through the shard the guild is on and
+        yields each [`hikari.events.shard_events.MemberChunkEvent`][] as a
+        sequence of members as soon as it is received. Discord sends up to 1000
+        members per chunk over the already open connection, which is much faster
+        than paginating through [`hikari.api.rest.RESTClient.fetch_members`][]
+        for large guilds.
+
+        If the full member list is being requested (no `query`, `limit` or
+        `users`) and the bot doesn't have the [`hikari.intents.Intents.GUILD_MEMBERS`][]
+        intent, this will fall back to fetching the members over REST instead.
+
+        Parameters
+        ----------
+        guild
+            The guild to request the members of.
+        query
+            If not an empty string, the username prefix to filter the members by.
+        limit
+            If not `0`, the max number of members to return.
+        users
+            If provided, the users to request the members of.
+        timeout
+            How long to wait for the next chunk before giving up. If
+            [`None`][] then this will wait until all the chunks are received.
+
+        Yields
+        ------
+        typing.Sequence[hikari.guilds.Member]
+            Each chunk of members.
+
+        Raises
+        ------
+        asyncio.TimeoutError
+            If `timeout` passes before the next chunk is received. The chunks
+            yielded up to that point don't make up the full result.
+        RuntimeError
+            If the guild passed isn't covered by any of the shards in this sharded
+            client.
+        hikari.errors.ComponentStateConflictError
+            If the guild's shard isn't connected or the bot isn't running.
+        hikari.errors.MissingIntentError
+            When `users` is provided without the
+            [`hikari.intents.Intents.GUILD_MEMBERS`][] intent.
+        ValueError
+            When trying to specify `users` with `query`/`limit`, if `limit` is not between
+            0 and 100, both inclusive or if `users` length is over 100.
+        """
+        self._check_if_alive()
+
+        if (
+            not query
+            and not limit
+            and users is undefined.UNDEFINED
+            and not self._intents & intents_.Intents.GUILD_MEMBERS
+        ):
+            async for members in self._rest.fetch_members(guild).chunk(1000):
+                yield members
+
+            return
+
+        shard = self._get_shard(guild)
+        nonce = f"{shard.id}.{time.fixed_size_nonce()}"
+
+        chunk_events = self._event_manager.stream(shard_events.MemberChunkEvent, timeout=timeout)
+
+        with chunk_events.filter(("nonce", nonce)) as stream:
+            await shard.request_guild_members(guild=guild, query=query, limit=limit, users=users, nonce=nonce)
+
+            async for event in stream:
+                yield tuple(event.members.values())
+
+                if event.chunk_index + 1 >= event.chunk_count:
+                    break
+
+            else:
+                # The stream only ends early when the timeout is reached.
+                msg = f"Timed out waiting for the member chunks of guild {snowflakes.Snowflake(guild)}"
+                raise asyncio.TimeoutError(msg)
+
+    async def get_or_fetch_member(
+        self,
+        guild: snowflakes.SnowflakeishOr[guilds.PartialGuild],
+        user: snowflakes.SnowflakeishOr[users_.PartialUser],
+        /,
+    ) -> guilds.Member:
+        """Get a member from the cache, fetching it over REST if it isn't cached.
+
+        Parameters
+        ----------
+        guild
+            Object or ID of the guild to get the member from.
+        user
+            Object or ID of the user to get the member for.
+
+        Returns
+        -------
+        hikari.guilds.Member
+            The cached member if found, else the fetched member.
+
+        Raises
+        ------
+        hikari.errors.NotFoundError
+            If the member isn't cached and the guild or the user are not found.
+        """
+        if (member := self._cache.get_member(guild, user)) is not None:
+            return member
+
+        return await self._rest.fetch_member(guild, user)
+
+    async def get_or_fetch_role(
+        self,
+        guild: snowflakes.SnowflakeishOr[guilds.PartialGuild],
+        role: snowflakes.SnowflakeishOr[guilds.PartialRole],
+        /,
+    ) -> guilds.Role:
+        """Get a role from the cache, fetching it over REST if it isn't cached.
+
+        Parameters
+        ----------
+        guild
+            Object or ID of the guild the role is in.
+        role
+            Object or ID of the role to get.
+
+        Returns
+        -------
+        hikari.guilds.Role
+            The cached role if found in the guild, else the fetched role.
+
+        Raises
+        ------
+        hikari.errors.NotFoundError
+            If the role isn't cached and the guild or the role are not found.
+        """
+        cached_role = self._cache.get_role(role)
+        if cached_role is not None and cached_role.guild_id == snowflakes.Snowflake(guild):
+            return cached_role
+
+        return await self._rest.fetch_role(guild, role)
+
     async def _start_one_shard(
         self,
         *,
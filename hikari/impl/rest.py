@@ -75,6 +75,7 @@
 from hikari.impl import rate_limits
 from hikari.impl import special_endpoints as special_endpoints_impl
 from hikari.interactions import base_interactions
+from hikari.internal import aio
 from hikari.internal import data_binding
 from hikari.internal import mentions
 from hikari.internal import net
@@ -119,6 +120,9 @@
 _X_RATELIMIT_SCOPE_HEADER: typing.Final[str] = sys.intern("X-RateLimit-Scope")
 _RETRY_ERROR_CODES: typing.Final[frozenset[int]] = frozenset((500, 502, 503, 504))
 _MAX_BACKOFF_DURATION: typing.Final[int] = 16
+_GATEWAY_URL_CACHE_TTL: typing.Final[float] = 3_600.0
+_VOICE_REGIONS_CACHE_TTL: typing.Final[float] = 3_600.0
+_STICKER_PACKS_CACHE_TTL: typing.Final[float] = 3_600.0
 _V2_COMPONENT_TYPES: typing.Final[frozenset[components_.ComponentType]] = frozenset(
     (
         components_.ComponentType.SECTION,
@@ -571,9 +575,11 @@ class RESTClientImpl(rest_api.RESTClient):
         "_entity_factory",
         "_executor",
         "_http_settings",
+        "_inflight_requests",
         "_loads",
         "_max_retries",
         "_proxy_settings",
+        "_response_cache",
         "_rest_url",
         "_token",
         "_token_type",
@@ -629,6 +635,10 @@ def __init__(
         self._client_session = client_session
         self._client_session_owner = client_session_owner
         self._close_event: asyncio.Event | None = None
+        self._response_cache: dict[routes.Route, tuple[float, data_binding.JSONObject | data_binding.JSONArray]] = {}
+        self._inflight_requests: dict[
+            tuple[typing.Hashable, ...], asyncio.Task[data_binding.JSONObject | data_binding.JSONArray | None]
+        ] = {}
 
         self._token: str | rest_api.TokenStrategy | None = None
         self._token_type: str | None = None
@@ -687,6 +697,11 @@ async def close(self) -> None:
         self._close_event.set()
         self._close_event = None
 
+        for task in self._inflight_requests.values():
+            task.cancel()
+
+        self._inflight_requests.clear()
+
         if self._client_session_owner:
             await self._client_session.close()
             self._client_session = None
@@ -694,6 +709,12 @@ async def close(self) -> None:
         if self._bucket_manager_owner:
             await self._bucket_manager.close()
 
+        self._response_cache.clear()
+
+    @typing_extensions.override
+    def clear_response_cache(self) -> None:
+        self._response_cache.clear()
+
     def start(self) -> None:
         """Start the HTTP client.
 
@@ -924,6 +945,69 @@ async def _request(  # noqa: C901, PLR0912, PLR0915
 
             raise await net.generate_error_response(response)
 
+    @typing.final
+    async def _request_cached(
+        self,
+        compiled_route: routes.CompiledRoute,
+        *,
+        ttl: float,
+        auth: undefined.UndefinedNoneOr[str] = undefined.UNDEFINED,
+    ) -> data_binding.JSONObject | data_binding.JSONArray:
+        # Only meant for routes without parameters, as the cache is keyed by the route.
+        now = time.time()
+        cached = self._response_cache.get(compiled_route.route)
+        if cached is not None and cached[0] > now:
+            return cached[1]
+
+        response = await self._request_shared(compiled_route, auth=auth)
+        assert response is not None
+        self._response_cache[compiled_route.route] = (now + ttl, response)
+        return response
+
+    @typing.final
+    async def _request_shared(
+        self,
+        compiled_route: routes.CompiledRoute,
+        *,
+        query: data_binding.StringMapBuilder | None = None,
+        auth: undefined.UndefinedNoneOr[str] = undefined.UNDEFINED,
+    ) -> data_binding.JSONObject | data_binding.JSONArray | None:
+        # Only meant for side-effect free GET requests. Concurrent calls for the same
+        # route, query and authorization share a single request instead of each making
+        # their own. The request is shielded so a cancelled caller does not cancel it
+        # for everyone else waiting on it.
+        #
+        # Every caller receives the same response payload (or the same exception
+        # instance), so the payload must be treated as read-only by whatever
+        # deserializes it, as is already the case for _request_cached.
+        key = (compiled_route, tuple(query.items()) if query else (), auth)
+        task = self._inflight_requests.get(key)
+        if task is None:
+            task = asyncio.create_task(self._request(compiled_route, query=query, auth=auth))
+            self._inflight_requests[key] = task
+
+            def on_done(done_task: asyncio.Task[typing.Any]) -> None:
+                if self._inflight_requests.get(key) is done_task:
+                    del self._inflight_requests[key]
+
+                # If every caller was cancelled, nobody is left to retrieve the error.
+                if not done_task.cancelled():
+                    done_task.exception()
+
+            task.add_done_callback(on_done)
+
+        try:
+            return await asyncio.shield(task)
+        except asyncio.CancelledError:
+            if not task.cancelled():
+                # Only this caller was cancelled, the request carries on for everyone else.
+                raise
+
+        # The shared request itself is only ever cancelled by close(), so fail the same
+        # way an unshared request on a closed client would rather than looking cancelled.
+        msg = "Cannot use an inactive REST client"
+        raise errors.ComponentStateConflictError(msg)
+
     @typing.final
     async def _parse_ratelimits(
         self, compiled_route: routes.CompiledRoute, authentication: str | None, response: aiohttp.ClientResponse
@@ -1425,7 +1509,7 @@ def _build_message_payload(  # noqa: C901, PLR0912, PLR0915
         content: undefined.UndefinedOr[typing.Any] = undefined.UNDEFINED,
         attachment: undefined.UndefinedNoneOr[files.Resourceish | messages_.Attachment] = undefined.UNDEFINED,
         attachments: undefined.UndefinedNoneOr[
-            typing.Sequence[files.Resourceish | messages_.Attachment]
+            typing.Iterable[files.Resourceish | messages_.Attachment]
         ] = undefined.UNDEFINED,
         component: undefined.UndefinedNoneOr[special_endpoints.ComponentBuilder] = undefined.UNDEFINED,
         components: undefined.UndefinedNoneOr[
@@ -2122,7 +2206,9 @@ async def execute_webhook(
         username: undefined.UndefinedOr[str] = undefined.UNDEFINED,
         avatar_url: undefined.UndefinedType | str | files.URL = undefined.UNDEFINED,
         attachment: undefined.UndefinedOr[files.Resourceish] = undefined.UNDEFINED,
-        attachments: undefined.UndefinedOr[typing.Sequence[files.Resourceish]] = undefined.UNDEFINED,
+        attachments: undefined.UndefinedOr[
+            typing.Iterable[files.Resourceish] | typing.AsyncIterable[files.Resourceish]
+        ] = undefined.UNDEFINED,
         component: undefined.UndefinedOr[special_endpoints.ComponentBuilder] = undefined.UNDEFINED,
         components: undefined.UndefinedOr[typing.Sequence[special_endpoints.ComponentBuilder]] = undefined.UNDEFINED,
         embed: undefined.UndefinedOr[embeds_.Embed] = undefined.UNDEFINED,
@@ -2147,6 +2233,10 @@ async def execute_webhook(
         query.put("with_components", True)
         query.put("thread_id", thread)
 
+        if isinstance(attachments, typing.AsyncIterable):
+            # The multipart form needs all of its parts before the request is made.
+            attachments = [resource async for resource in attachments]
+
         body, form_builder = self._build_message_payload(
             content=content,
             attachment=attachment,
@@ -2203,7 +2293,8 @@ async def edit_webhook_message(
         thread: undefined.UndefinedType | snowflakes.SnowflakeishOr[channels_.GuildThreadChannel] = undefined.UNDEFINED,
         attachment: undefined.UndefinedNoneOr[files.Resourceish | messages_.Attachment] = undefined.UNDEFINED,
         attachments: undefined.UndefinedNoneOr[
-            typing.Sequence[files.Resourceish | messages_.Attachment]
+            typing.Iterable[files.Resourceish | messages_.Attachment]
+            | typing.AsyncIterable[files.Resourceish | messages_.Attachment]
         ] = undefined.UNDEFINED,
         component: undefined.UndefinedNoneOr[special_endpoints.ComponentBuilder] = undefined.UNDEFINED,
         components: undefined.UndefinedNoneOr[
@@ -2226,6 +2317,10 @@ async def edit_webhook_message(
         query.put("with_components", True)
         query.put("thread_id", thread)
 
+        if isinstance(attachments, typing.AsyncIterable):
+            # The multipart form needs all of its parts before the request is made.
+            attachments = [resource async for resource in attachments]
+
         body, form_builder = self._build_message_payload(
             content=content,
             attachment=attachment,
@@ -2265,11 +2360,51 @@ async def delete_webhook_message(
         route = routes.DELETE_WEBHOOK_MESSAGE.compile(webhook=webhook_id, token=token, message=message)
         await self._request(route, query=query, auth=None)
 
+    @typing_extensions.override
+    async def delete_webhook_messages(
+        self,
+        webhook: webhooks.ExecutableWebhook | snowflakes.Snowflakeish,
+        token: str,
+        messages: typing.Iterable[snowflakes.SnowflakeishOr[messages_.Message]]
+        | typing.AsyncIterable[snowflakes.SnowflakeishOr[messages_.Message]],
+        *,
+        thread: undefined.UndefinedType | snowflakes.SnowflakeishOr[channels_.GuildThreadChannel] = undefined.UNDEFINED,
+    ) -> None:
+        # int(ExecutableWebhook) isn't guaranteed to be valid nor the ID used to execute this entity as a webhook.
+        webhook_id = webhook if isinstance(webhook, int) else webhook.webhook_id
+        query = data_binding.StringMapBuilder()
+        query.put("thread_id", thread)
+
+        iterator: iterators.LazyIterator[snowflakes.SnowflakeishOr[messages_.Message]]
+        if isinstance(messages, typing.AsyncIterable):
+            iterator = iterators.NOOPLazyIterator(messages)
+        else:
+            iterator = iterators.FlatLazyIterator(messages)
+
+        deleted: list[snowflakes.SnowflakeishOr[messages_.Message]] = []
+        # Webhooks have no bulk delete endpoint and every message shares the same
+        # bucket, so these are sent sequentially rather than gathered.
+        async for message in iterator:
+            route = routes.DELETE_WEBHOOK_MESSAGE.compile(webhook=webhook_id, token=token, message=message)
+            try:
+                try:
+                    await self._request(route, query=query, auth=None)
+                except errors.NotFoundError as ex:
+                    # If the message is not found then this error should be suppressed
+                    # to keep consistency with how delete_messages functions.
+                    if ex.code != 10008:  # Unknown Message
+                        raise
+
+            except Exception as ex:
+                raise errors.BulkDeleteError(deleted) from ex
+
+            deleted.append(message)
+
     @typing_extensions.override
     async def fetch_gateway_url(self) -> str:
         route = routes.GET_GATEWAY.compile()
         # This doesn't need authorization.
-        response = await self._request(route, auth=None)
+        response = await self._request_cached(route, ttl=_GATEWAY_URL_CACHE_TTL, auth=None)
         assert isinstance(response, dict)
         url = response["url"]
         assert isinstance(url, str)
@@ -2350,6 +2485,7 @@ def fetch_my_guilds(
         *,
         newest_first: bool = False,
         start_at: undefined.UndefinedOr[snowflakes.SearchableSnowflakeishOr[guilds.PartialGuild]] = undefined.UNDEFINED,
+        prefetch: bool = False,
     ) -> iterators.LazyIterator[applications.OwnGuild]:
         if start_at is undefined.UNDEFINED:
             start_at = snowflakes.Snowflake.max() if newest_first else snowflakes.Snowflake.min()
@@ -2363,6 +2499,7 @@ def fetch_my_guilds(
             request_call=self._request,
             newest_first=newest_first,
             first_id=str(start_at),
+            prefetch=prefetch,
         )
 
     @typing_extensions.override
@@ -2425,6 +2562,13 @@ async def create_dm_channel(self, user: snowflakes.SnowflakeishOr[users.PartialU
 
         return channel
 
+    @typing_extensions.override
+    async def create_dm_channels(
+        self, users: typing.Iterable[snowflakes.SnowflakeishOr[users.PartialUser]], /
+    ) -> typing.Sequence[channels_.DMChannel]:
+        # These all share a single bucket, so the bucket manager decides how many go out at once.
+        return await aio.all_of(*(self.create_dm_channel(user) for user in users))
+
     @typing_extensions.override
     async def fetch_application(self) -> applications.Application:
         route = routes.GET_MY_APPLICATION.compile()
@@ -2570,7 +2714,7 @@ async def add_user_to_guild(
     @typing_extensions.override
     async def fetch_voice_regions(self) -> typing.Sequence[voices.VoiceRegion]:
         route = routes.GET_VOICE_REGIONS.compile()
-        response = await self._request(route)
+        response = await self._request_cached(route, ttl=_VOICE_REGIONS_CACHE_TTL)
         assert isinstance(response, list)
         return [
             self._entity_factory.deserialize_voice_region(voice_region_payload) for voice_region_payload in response
@@ -2591,6 +2735,7 @@ def fetch_audit_log(
         before: undefined.UndefinedOr[snowflakes.SearchableSnowflakeishOr[snowflakes.Unique]] = undefined.UNDEFINED,
         user: undefined.UndefinedOr[snowflakes.SnowflakeishOr[users.PartialUser]] = undefined.UNDEFINED,
         event_type: undefined.UndefinedOr[audit_logs.AuditLogEventType | int] = undefined.UNDEFINED,
+        prefetch: bool = False,
     ) -> iterators.LazyIterator[audit_logs.AuditLog]:
         timestamp: undefined.UndefinedOr[str]
         if before is undefined.UNDEFINED:
@@ -2607,6 +2752,7 @@ def fetch_audit_log(
             before=timestamp,
             user=user,
             action_type=event_type,
+            prefetch=prefetch,
         )
 
     @typing_extensions.override
@@ -2616,7 +2762,7 @@ async def fetch_emoji(
         emoji: snowflakes.SnowflakeishOr[emojis.CustomEmoji],
     ) -> emojis.KnownCustomEmoji:
         route = routes.GET_GUILD_EMOJI.compile(guild=guild, emoji=emoji)
-        response = await self._request(route)
+        response = await self._request_shared(route)
         assert isinstance(response, dict)
         return self._entity_factory.deserialize_known_custom_emoji(response, guild_id=snowflakes.Snowflake(guild))
 
@@ -2750,7 +2896,7 @@ async def delete_application_emoji(
     @typing_extensions.override
     async def fetch_available_sticker_packs(self) -> typing.Sequence[stickers_.StickerPack]:
         route = routes.GET_STICKER_PACKS.compile()
-        response = await self._request(route, auth=None)
+        response = await self._request_cached(route, ttl=_STICKER_PACKS_CACHE_TTL, auth=None)
         assert isinstance(response, dict)
         return [
             self._entity_factory.deserialize_sticker_pack(sticker_pack_payload)
@@ -2762,7 +2908,7 @@ async def fetch_sticker(
         self, sticker: snowflakes.SnowflakeishOr[stickers_.PartialSticker]
     ) -> stickers_.StandardSticker | stickers_.GuildSticker:
         route = routes.GET_STICKER.compile(sticker=sticker)
-        response = await self._request(route)
+        response = await self._request_shared(route)
         assert isinstance(response, dict)
         return (
             self._entity_factory.deserialize_guild_sticker(response)
@@ -2851,14 +2997,14 @@ async def fetch_guild(self, guild: snowflakes.SnowflakeishOr[guilds.PartialGuild
         route = routes.GET_GUILD.compile(guild=guild)
         query = data_binding.StringMapBuilder()
         query.put("with_counts", True)
-        response = await self._request(route, query=query)
+        response = await self._request_shared(route, query=query)
         assert isinstance(response, dict)
         return self._entity_factory.deserialize_rest_guild(response)
 
     @typing_extensions.override
     async def fetch_guild_preview(self, guild: snowflakes.SnowflakeishOr[guilds.PartialGuild]) -> guilds.GuildPreview:
         route = routes.GET_GUILD_PREVIEW.compile(guild=guild)
-        response = await self._request(route)
+        response = await self._request_shared(route)
         assert isinstance(response, dict)
         return self._entity_factory.deserialize_guild_preview(response)
 
@@ -3444,6 +3590,28 @@ async def add_thread_member(
         route = routes.PUT_THREAD_MEMBER.compile(channel=channel, user=user)
         await self._request(route)
 
+    @typing_extensions.override
+    async def add_thread_members(
+        self,
+        channel: snowflakes.SnowflakeishOr[channels_.GuildThreadChannel],
+        users: typing.Iterable[snowflakes.SnowflakeishOr[users.PartialUser]],
+        /,
+        *,
+        concurrency: int = 64,
+    ) -> None:
+        if concurrency < 1:
+            msg = "'concurrency' must be greater than 0"
+            raise ValueError(msg)
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def add(user_id: snowflakes.Snowflake) -> None:
+            async with semaphore:
+                await self.add_thread_member(channel, user_id)
+
+        user_ids = dict.fromkeys(map(snowflakes.Snowflake, users))
+        await aio.all_of(*(add(user_id) for user_id in user_ids))
+
     @typing_extensions.override
     async def leave_thread(self, channel: snowflakes.SnowflakeishOr[channels_.GuildThreadChannel]) -> None:
         route = routes.DELETE_MY_THREAD_MEMBER.compile(channel=channel)
@@ -3459,6 +3627,28 @@ async def remove_thread_member(
         route = routes.DELETE_THREAD_MEMBER.compile(channel=channel, user=user)
         await self._request(route)
 
+    @typing_extensions.override
+    async def remove_thread_members(
+        self,
+        channel: snowflakes.SnowflakeishOr[channels_.GuildThreadChannel],
+        users: typing.Iterable[snowflakes.SnowflakeishOr[users.PartialUser]],
+        /,
+        *,
+        concurrency: int = 64,
+    ) -> None:
+        if concurrency < 1:
+            msg = "'concurrency' must be greater than 0"
+            raise ValueError(msg)
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def remove(user_id: snowflakes.Snowflake) -> None:
+            async with semaphore:
+                await self.remove_thread_member(channel, user_id)
+
+        user_ids = dict.fromkeys(map(snowflakes.Snowflake, users))
+        await aio.all_of(*(remove(user_id) for user_id in user_ids))
+
     @typing_extensions.override
     async def fetch_thread_member(
         self,
@@ -3467,7 +3657,7 @@ async def fetch_thread_member(
         /,
     ) -> channels_.ThreadMember:
         route = routes.GET_THREAD_MEMBER.compile(channel=channel, user=user)
-        response = await self._request(route)
+        response = await self._request_shared(route)
         assert isinstance(response, dict)
         return self._entity_factory.deserialize_thread_member(response)
 
@@ -3476,7 +3666,7 @@ async def fetch_thread_members(
         self, channel: snowflakes.SnowflakeishOr[channels_.GuildThreadChannel], /
     ) -> typing.Sequence[channels_.ThreadMember]:
         route = routes.GET_THREAD_MEMBERS.compile(channel=channel)
-        response = await self._request(route)
+        response = await self._request_shared(route)
         assert isinstance(response, list)
         return [self._entity_factory.deserialize_thread_member(member) for member in response]
 
@@ -3485,7 +3675,7 @@ async def fetch_active_threads(
         self, guild: snowflakes.SnowflakeishOr[guilds.Guild], /
     ) -> typing.Sequence[channels_.GuildThreadChannel]:
         route = routes.GET_ACTIVE_THREADS.compile(guild=guild)
-        response = await self._request(route)
+        response = await self._request_shared(route)
         assert isinstance(response, dict)
         members = {
             member.thread_id: member
@@ -3516,6 +3706,7 @@ def fetch_public_archived_threads(
         /,
         *,
         before: undefined.UndefinedOr[datetime.datetime] = undefined.UNDEFINED,
+        prefetch: bool = False,
     ) -> iterators.LazyIterator[channels_.GuildNewsThread | channels_.GuildPublicThread]:
         return special_endpoints_impl.GuildThreadIterator(
             deserialize=self._deserialize_public_thread,
@@ -3524,6 +3715,7 @@ def fetch_public_archived_threads(
             route=routes.GET_PUBLIC_ARCHIVED_THREADS.compile(channel=channel),
             before=before.isoformat() if before is not undefined.UNDEFINED else undefined.UNDEFINED,
             before_is_timestamp=True,
+            prefetch=prefetch,
         )
 
     @typing_extensions.override
@@ -3533,6 +3725,7 @@ def fetch_private_archived_threads(
         /,
         *,
         before: undefined.UndefinedOr[datetime.datetime] = undefined.UNDEFINED,
+        prefetch: bool = False,
     ) -> iterators.LazyIterator[channels_.GuildPrivateThread]:
         return special_endpoints_impl.GuildThreadIterator(
             deserialize=self._entity_factory.deserialize_guild_private_thread,
@@ -3541,6 +3734,7 @@ def fetch_private_archived_threads(
             route=routes.GET_PRIVATE_ARCHIVED_THREADS.compile(channel=channel),
             before=before.isoformat() if before is not undefined.UNDEFINED else undefined.UNDEFINED,
             before_is_timestamp=True,
+            prefetch=prefetch,
         )
 
     @typing_extensions.override
@@ -3552,6 +3746,7 @@ def fetch_joined_private_archived_threads(
         before: undefined.UndefinedOr[
             snowflakes.SearchableSnowflakeishOr[channels_.GuildThreadChannel]
         ] = undefined.UNDEFINED,
+        prefetch: bool = False,
     ) -> iterators.LazyIterator[channels_.GuildPrivateThread]:
         if before is undefined.UNDEFINED:
             start: undefined.UndefinedOr[str] = undefined.UNDEFINED
@@ -3569,6 +3764,7 @@ def fetch_joined_private_archived_threads(
             route=routes.GET_JOINED_PRIVATE_ARCHIVED_THREADS.compile(channel=channel),
             before=start,
             before_is_timestamp=False,
+            prefetch=prefetch,
         )
 
     @typing_extensions.override
@@ -3595,6 +3791,34 @@ async def fetch_member(
         assert isinstance(response, dict)
         return self._entity_factory.deserialize_member(response, guild_id=snowflakes.Snowflake(guild))
 
+    @typing_extensions.override
+    async def fetch_members_bulk(
+        self,
+        guild: snowflakes.SnowflakeishOr[guilds.PartialGuild],
+        users: typing.Iterable[snowflakes.SnowflakeishOr[users.PartialUser]],
+        *,
+        concurrency: int = 64,
+    ) -> typing.Mapping[snowflakes.Snowflake, guilds.Member]:
+        if concurrency < 1:
+            msg = "'concurrency' must be greater than 0"
+            raise ValueError(msg)
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def fetch(user_id: snowflakes.Snowflake) -> guilds.Member | None:
+            async with semaphore:
+                try:
+                    return await self.fetch_member(guild, user_id)
+                except errors.NotFoundError as ex:
+                    if ex.code not in (10007, 10013):  # Unknown Member, Unknown User
+                        raise
+
+                    return None
+
+        user_ids = dict.fromkeys(map(snowflakes.Snowflake, users))
+        members = await aio.all_of(*(fetch(user_id) for user_id in user_ids))
+        return {user_id: member for user_id, member in zip(user_ids, members) if member is not None}
+
     @typing_extensions.override
     def fetch_members(
         self,
@@ -3602,9 +3826,15 @@ def fetch_members(
         *,
         after: undefined.UndefinedOr[snowflakes.SnowflakeishOr[users.PartialUser]] = undefined.UNDEFINED,
         limit: undefined.UndefinedOr[int] = undefined.UNDEFINED,
+        prefetch: bool = False,
     ) -> iterators.LazyIterator[guilds.Member]:
         return special_endpoints_impl.MemberIterator(
-            entity_factory=self._entity_factory, request_call=self._request, guild=guild, after=after, limit=limit
+            entity_factory=self._entity_factory,
+            request_call=self._request,
+            guild=guild,
+            after=after,
+            limit=limit,
+            prefetch=prefetch,
         )
 
     @typing_extensions.override
@@ -3622,7 +3852,7 @@ async def search_members(
         query = data_binding.StringMapBuilder()
         query.put("query", name)
         query.put("limit", 1000)
-        response = await self._request(route, query=query)
+        response = await self._request_shared(route, query=query)
         assert isinstance(response, list)
         guild_id = snowflakes.Snowflake(guild)
         return [
@@ -3706,6 +3936,37 @@ async def remove_role_from_member(
         route = routes.DELETE_GUILD_MEMBER_ROLE.compile(guild=guild, user=user, role=role)
         await self._request(route, reason=reason)
 
+    @typing_extensions.override
+    async def set_member_roles(
+        self,
+        guild: snowflakes.SnowflakeishOr[guilds.PartialGuild],
+        user: snowflakes.SnowflakeishOr[users.PartialUser],
+        *,
+        add: snowflakes.SnowflakeishSequence[guilds.PartialRole] = (),
+        remove: snowflakes.SnowflakeishSequence[guilds.PartialRole] = (),
+        reason: undefined.UndefinedOr[str] = undefined.UNDEFINED,
+    ) -> guilds.Member:
+        member = await self.fetch_member(guild, user)
+        # The member's role IDs include the guild ID for the @everyone role,
+        # which can't be sent in the roles of a member edit.
+        everyone_role_id = snowflakes.Snowflake(guild)
+        current_role_ids = set(member.role_ids)
+        current_role_ids.discard(everyone_role_id)
+        # dict keeps the member's existing role order stable in the request body.
+        role_ids = dict.fromkeys(member.role_ids)
+        role_ids.update(dict.fromkeys(map(snowflakes.Snowflake, add)))
+        for role_id in map(snowflakes.Snowflake, remove):
+            role_ids.pop(role_id, None)
+
+        role_ids.pop(everyone_role_id, None)
+
+        if role_ids.keys() == current_role_ids:
+            # Every role to add is already present and every role to remove is
+            # already absent, so there is nothing to edit.
+            return member
+
+        return await self.edit_member(guild, user, roles=list(role_ids), reason=reason)
+
     @typing_extensions.override
     async def kick_user(
         self,
@@ -3793,6 +4054,7 @@ def fetch_bans(
         *,
         newest_first: bool = False,
         start_at: undefined.UndefinedOr[snowflakes.SearchableSnowflakeishOr[users.PartialUser]] = undefined.UNDEFINED,
+        prefetch: bool = False,
     ) -> iterators.LazyIterator[guilds.GuildBan]:
         if start_at is undefined.UNDEFINED:
             start_at = snowflakes.Snowflake.max() if newest_first else snowflakes.Snowflake.min()
@@ -3802,7 +4064,12 @@ def fetch_bans(
             start_at = int(start_at)
 
         return special_endpoints_impl.GuildBanIterator(
-            self._entity_factory, self._request, guild, newest_first=newest_first, first_id=str(start_at)
+            self._entity_factory,
+            self._request,
+            guild,
+            newest_first=newest_first,
+            first_id=str(start_at),
+            prefetch=prefetch,
         )
 
     @typing_extensions.override
@@ -448,8 +448,9 @@ def __init__(
         *,
         newest_first: bool,
         first_id: str,
+        prefetch: bool = False,
     ) -> None:
-        super().__init__()
+        super().__init__(prefetch=prefetch)
         self._entity_factory = entity_factory
         self._newest_first = newest_first
         self._request_call = request_call
@@ -500,8 +501,9 @@ def __init__(
         *,
         newest_first: bool,
         first_id: str,
+        prefetch: bool = False,
     ) -> None:
-        super().__init__()
+        super().__init__(prefetch=prefetch)
         self._guild_id = snowflakes.Snowflake(str(int(guild)))
         self._route = routes.GET_GUILD_BANS.compile(guild=guild)
         self._request_call = request_call
@@ -545,8 +547,9 @@ def __init__(
         *,
         after: undefined.UndefinedNoneOr[snowflakes.SnowflakeishOr[users.PartialUser]] = undefined.UNDEFINED,
         limit: undefined.UndefinedOr[int] = 1000,
+        prefetch: bool = False,
     ) -> None:
-        super().__init__()
+        super().__init__(prefetch=prefetch)
         self._guild_id = snowflakes.Snowflake(str(int(guild)))
         self._route = routes.GET_GUILD_MEMBERS.compile(guild=guild)
         self._request_call = request_call
@@ -630,7 +633,7 @@ async def _next_chunk(self) -> typing.Generator[scheduled_events.ScheduledEventU
 # We use an explicit forward reference for this, since this breaks potential
 # circular import issues (once the file has executed, using those resources is
 # not an issue for us).
-class AuditLogIterator(iterators.LazyIterator["audit_logs.AuditLog"]):
+class AuditLogIterator(iterators.BufferedLazyIterator["audit_logs.AuditLog"]):
     """Iterator implementation for an audit log."""
 
     __slots__: typing.Sequence[str] = (
@@ -651,7 +654,10 @@ def __init__(
         before: undefined.UndefinedOr[str],
         user: undefined.UndefinedOr[snowflakes.SnowflakeishOr[users.PartialUser]],
         action_type: undefined.UndefinedOr[audit_logs.AuditLogEventType | int],
+        *,
+        prefetch: bool = False,
     ) -> None:
+        super().__init__(prefetch=prefetch)
         self._action_type = action_type
         self._entity_factory = entity_factory
         self._first_id = before
@@ -661,7 +667,7 @@ def __init__(
         self._user = user
 
     @typing_extensions.override
-    async def __anext__(self) -> audit_logs.AuditLog:
+    async def _next_chunk(self) -> typing.Generator[audit_logs.AuditLog, None, None] | None:
         query = data_binding.StringMapBuilder()
         query.put("limit", 100)
         query.put("user_id", self._user)
@@ -673,14 +679,14 @@ async def __anext__(self) -> audit_logs.AuditLog:
 
         audit_log_entries = response["audit_log_entries"]
         if not audit_log_entries:
-            raise StopAsyncIteration
+            return None
 
-        log = self._entity_factory.deserialize_audit_log(response, guild_id=self._guild_id)
         # Since deserialize_audit_log may skip entries it doesn't recognise,
         # first_id has to be calculated based on the raw payload as log.entries
         # may be missing entries.
         self._first_id = str(min(entry["id"] for entry in audit_log_entries))
-        return log
+        # Each page is a single audit log object.
+        return (self._entity_factory.deserialize_audit_log(page, guild_id=self._guild_id) for page in (response,))
 
 
 class GuildThreadIterator(iterators.BufferedLazyIterator[_GuildThreadChannelT]):
@@ -705,8 +711,9 @@ def __init__(
         before: undefined.UndefinedOr[str],
         *,
         before_is_timestamp: bool,
+        prefetch: bool = False,
     ) -> None:
-        super().__init__()
+        super().__init__(prefetch=prefetch)
         self._before_is_timestamp = before_is_timestamp
         self._deserialize = deserialize
         self._entity_factory = entity_factory
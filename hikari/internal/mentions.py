@@ -33,6 +33,9 @@
     from hikari import users
     from hikari.internal import data_binding
 
+_MAX_MENTIONS: typing.Final[int] = 100
+"""The maximum number of unique users or roles which may be explicitly allowed to be mentioned."""
+
 
 def generate_allowed_mentions(
     mentions_everyone: undefined.UndefinedOr[bool],
@@ -51,11 +54,11 @@ def generate_allowed_mentions(
         Whether the reply mention should be enabled. If [`hikari.undefined.UNDEFINED`][]
         or [`False`][] then this will be disabled.
     user_mentions
-        Either a sequence of objects/IDs of the users to enabled mentions for,
+        Either a collection of objects/IDs of the users to enabled mentions for,
         [`True`][] to allow all mentions or [`False`][]/[`hikari.undefined.UNDEFINED`][]
         to disable all user mentions.
     role_mentions
-        Either a sequence of objects/IDs of the roles to enabled mentions for,
+        Either a collection of objects/IDs of the roles to enabled mentions for,
         [`True`][] to allow all mentions or [`False`][]/[`hikari.undefined.UNDEFINED`][]
         to disable all user mentions.
 
@@ -63,6 +66,12 @@ def generate_allowed_mentions(
     -------
     hikari.internal.data_binding.JSONObject
         The allowed mentions JSON Object.
+
+    Raises
+    ------
+    ValueError
+        If more than 100 unique objects/entities are passed for
+        `role_mentions` or `user_mentions`.
     """
     parsed_mentions: list[str] = []
     allowed_mentions: dict[str, typing.Any] = {"parse": parsed_mentions}
@@ -76,15 +85,24 @@ def generate_allowed_mentions(
     if user_mentions is True:
         parsed_mentions.append("users")
     elif isinstance(user_mentions, typing.Collection):
-        # Duplicates will cause Discord to error.
-        ids = {str(int(u)) for u in user_mentions}
-        allowed_mentions["users"] = list(ids)
+        allowed_mentions["users"] = _unique_ids("user_mentions", user_mentions)
 
     if role_mentions is True:
         parsed_mentions.append("roles")
     elif isinstance(role_mentions, typing.Collection):
-        # Duplicates will cause Discord to error.
-        ids = {str(int(r)) for r in role_mentions}
-        allowed_mentions["roles"] = list(ids)
+        allowed_mentions["roles"] = _unique_ids("role_mentions", role_mentions)
 
     return allowed_mentions
+
+
+def _unique_ids(name: str, values: typing.Collection[snowflakes.SnowflakeishOr[snowflakes.Unique]]) -> list[str]:
+    # Duplicates will cause Discord to error.
+    ids = {str(int(v)) for v in values}
+
+    # The input may hold the same ID in several forms (e.g. 123, "123" and an object),
+    # so only the deduplicated IDs can be checked against the limit.
+    if len(ids) > _MAX_MENTIONS:
+        msg = f"Cannot allow more than {_MAX_MENTIONS} unique {name}"
+        raise ValueError(msg)
+
+    return list(ids)
@@ -84,7 +84,8 @@ def create_tcp_connector(http_settings: config.HTTPSettings, *, dns_cache: bool
     Optional Parameters
     -------------------
     dns_cache
-        If [`True`][], DNS caching is used with a default TTL of 10 seconds.
+        If [`True`][], DNS caching is used with the TTL set in
+        `http_settings.dns_cache_ttl`.
         If [`False`][], DNS caching is disabled. If an [`int`][] is
         given, then DNS caching is enabled with an explicit TTL set. If
         [`None`][], the cache will be enabled and never invalidate.
@@ -99,9 +100,12 @@ def create_tcp_connector(http_settings: config.HTTPSettings, *, dns_cache: bool
     return aiohttp.TCPConnector(
         enable_cleanup_closed=http_settings.enable_cleanup_closed,
         force_close=http_settings.force_close_transports,
+        # aiohttp refuses a keep-alive timeout for connections that are always closed.
+        keepalive_timeout=None if http_settings.force_close_transports else http_settings.keepalive_timeout,
         limit=http_settings.connection_limit,
+        limit_per_host=http_settings.connection_limit_per_host,
         ssl=http_settings.ssl,
-        ttl_dns_cache=dns_cache if not isinstance(dns_cache, bool) else 10,
+        ttl_dns_cache=dns_cache if not isinstance(dns_cache, bool) else http_settings.dns_cache_ttl,
         use_dns_cache=dns_cache is not False,
     )
 
@@ -27,6 +27,7 @@
     "Intervalish",
     "datetime_to_discord_epoch",
     "discord_epoch_to_datetime",
+    "fixed_size_nonce",
     "local_datetime",
     "time",
     "time_ns",
@@ -36,7 +37,9 @@
     "uuid",
 )
 
+import base64
 import datetime
+import random
 import time as time_
 import typing
 import uuid as uuid_
@@ -61,6 +64,12 @@
 * [Discord API documentation - Snowflakes](https://discord.com/developers/docs/reference#snowflakes)
 """
 
+# DISCORD_EPOCH in milliseconds, to convert Discord epochs with plain integer arithmetic.
+_DISCORD_EPOCH_MS: typing.Final[int] = 1_420_070_400_000
+
+# DISCORD_EPOCH as an aware datetime, to convert datetimes without going through floats.
+_DISCORD_EPOCH_DT: typing.Final[datetime.datetime] = datetime.datetime(2015, 1, 1, tzinfo=datetime.timezone.utc)
+
 
 # Default to the standard lib parser, that isn't really ISO compliant but seems
 # to work for what we need.
@@ -116,7 +125,7 @@ def discord_epoch_to_datetime(epoch: int, /) -> datetime.datetime:
     datetime.datetime
         Number of seconds since [1/1/1970 00:00:00 UTC][].
     """
-    return datetime.datetime.fromtimestamp(epoch / 1_000, datetime.timezone.utc) + DISCORD_EPOCH
+    return datetime.datetime.fromtimestamp((epoch + _DISCORD_EPOCH_MS) / 1_000, datetime.timezone.utc)
 
 
 def datetime_to_discord_epoch(timestamp: datetime.datetime) -> int:
@@ -132,7 +141,11 @@ def datetime_to_discord_epoch(timestamp: datetime.datetime) -> int:
     int
         Number of milliseconds since `1/1/2015 00:00:00 UTC`.
     """
-    return int((timestamp - DISCORD_EPOCH).timestamp() * 1_000)
+    if timestamp.tzinfo is None:
+        # Naive datetimes are treated as local time, like datetime.timestamp does.
+        timestamp = timestamp.astimezone()
+
+    return (timestamp - _DISCORD_EPOCH_DT) // datetime.timedelta(milliseconds=1)
 
 
 def unix_epoch_to_datetime(epoch: float, /, *, is_millis: bool = True) -> datetime.datetime:
@@ -217,3 +230,14 @@ def time_ns() -> int:
 def uuid() -> str:
     """Generate a unique UUID (1ns precision)."""
     return uuid_.uuid1(None, time_ns()).hex
+
+
+def fixed_size_nonce() -> str:
+    """Generate a unique nonce of a fixed length of 28 characters.
+
+    This is used to identify the responses to gateway requests, such as
+    member chunks.
+    """
+    head = time_ns().to_bytes(8, "big")
+    tail = random.getrandbits(92).to_bytes(12, "big")
+    return base64.b64encode(head + tail).decode("ascii")
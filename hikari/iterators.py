@@ -715,6 +715,19 @@ def __iter__(self) -> LazyIterator[ValueT]:
     async def _fetch_all(self) -> typing.Sequence[ValueT]:
         return [item async for item in self]
 
+    async def aclose(self) -> None:
+        """Stop this iterator, cancelling any request it has made ahead of time.
+
+        Iterators created with `prefetch=True` request the next page of
+        results before it is needed. If iteration is stopped early, such as
+        by breaking out of an `async for` loop, call this so that request is
+        cancelled rather than left running. Once closed, the iterator
+        yields no further items.
+
+        This does nothing for iterators which don't make requests ahead of
+        time, so it is always safe to call.
+        """
+
     def __await__(self) -> typing.Generator[None, None, typing.Sequence[ValueT]]:
         return self._fetch_all().__await__()
 
@@ -735,6 +748,11 @@ def _flatten(value: ValueT) -> ValueT:
     return value
 
 
+def _retrieve_exception(task: asyncio.Task[typing.Any]) -> None:
+    if not task.cancelled():
+        task.exception()
+
+
 class BufferedLazyIterator(typing.Generic[ValueT], LazyIterator[ValueT], abc.ABC):
     """A special kind of lazy iterator that is used by internal components.
 
@@ -754,6 +772,13 @@ class BufferedLazyIterator(typing.Generic[ValueT], LazyIterator[ValueT], abc.ABC
     This `_next_chunk` should return [`None`][] once the end of all items
     has been reached.
 
+    If `prefetch` is [`True`][], the next call to `_next_chunk` is scheduled
+    as a task as soon as a chunk is received, so the request for the next
+    page runs while the current one is being consumed. Implementations
+    must therefore only rely on state set by the previous call to
+    `_next_chunk` (such as a pagination cursor), as only one call is ever
+    in progress at a time.
+
     An example would look like the following:
 
     ```py
@@ -779,14 +804,60 @@ def _next_chunk(
     ```
     """
 
-    __slots__: typing.Sequence[str] = ("_buffer",)
+    __slots__: typing.Sequence[str] = ("_buffer", "_prefetch", "_prefetch_task")
 
-    def __init__(self) -> None:
+    def __init__(self, *, prefetch: bool = False) -> None:
         self._buffer: typing.Generator[ValueT, None, None] | None = (_ for _ in ())
+        self._prefetch = prefetch
+        self._prefetch_task: asyncio.Task[typing.Generator[ValueT, None, None] | None] | None = None
 
     @abc.abstractmethod
     async def _next_chunk(self) -> typing.Generator[ValueT, None, None] | None: ...
 
+    async def _fetch_chunk(self) -> typing.Generator[ValueT, None, None] | None:
+        if (prefetch_task := self._prefetch_task) is not None:
+            # Cleared before awaiting, so a failed prefetch isn't awaited again.
+            self._prefetch_task = None
+            chunk = await prefetch_task
+        else:
+            chunk = await self._next_chunk()
+
+        if chunk is not None and self._prefetch:
+            self._prefetch_task = asyncio.create_task(self._next_chunk())
+            # If the iterator is abandoned, the error would otherwise be logged as never retrieved.
+            self._prefetch_task.add_done_callback(_retrieve_exception)
+
+        return chunk
+
+    def _cancel_prefetch(self) -> None:
+        # A prefetch which already finished is kept, so its chunk isn't lost if iteration continues.
+        if (prefetch_task := self._prefetch_task) is not None and not prefetch_task.done():
+            self._prefetch_task = None
+            prefetch_task.cancel()
+
+    @typing_extensions.override
+    def limit(self, limit: int) -> LazyIterator[ValueT]:
+        # This iterator may still be reused once the limit is reached, so only stop a request made ahead of time.
+        return _LimitedLazyIterator(self, limit, on_limit_reached=self._cancel_prefetch)
+
+    @typing_extensions.override
+    async def aclose(self) -> None:
+        self._buffer = None
+
+        if (prefetch_task := self._prefetch_task) is not None:
+            self._prefetch_task = None
+            prefetch_task.cancel()
+
+    @typing_extensions.override
+    async def _fetch_all(self) -> typing.Sequence[ValueT]:
+        # Consume whole chunks at a time rather than awaiting __anext__ for every item.
+        items: list[ValueT] = []
+        while self._buffer is not None:
+            items.extend(self._buffer)
+            self._buffer = await self._fetch_chunk()
+
+        return items
+
     @typing_extensions.override
     async def __anext__(self) -> ValueT:
         # This sneaky snippet of code let's us use generators rather than lists.
@@ -798,7 +869,7 @@ async def __anext__(self) -> ValueT:
             if self._buffer is not None:
                 return next(self._buffer)
         except StopIteration:
-            self._buffer = await self._next_chunk()
+            self._buffer = await self._fetch_chunk()
             if self._buffer is not None:
                 return next(self._buffer)
 
@@ -851,6 +922,10 @@ def __init__(self, iterator: LazyIterator[ValueT], *, start: int) -> None:
         self._i = start
         self._iterator = iterator
 
+    @typing_extensions.override
+    async def aclose(self) -> None:
+        await self._iterator.aclose()
+
     @typing_extensions.override
     async def __anext__(self) -> tuple[int, ValueT]:
         pair = self._i, await self._iterator.__anext__()
@@ -859,19 +934,29 @@ async def __anext__(self) -> tuple[int, ValueT]:
 
 
 class _LimitedLazyIterator(typing.Generic[ValueT], LazyIterator[ValueT]):
-    __slots__: typing.Sequence[str] = ("_count", "_iterator", "_limit")
+    __slots__: typing.Sequence[str] = ("_count", "_iterator", "_limit", "_on_limit_reached")
 
-    def __init__(self, iterator: LazyIterator[ValueT], limit: int) -> None:
+    def __init__(
+        self, iterator: LazyIterator[ValueT], limit: int, *, on_limit_reached: typing.Callable[[], None] | None = None
+    ) -> None:
         if limit <= 0:
             msg = "limit must be positive and non-zero"
             raise ValueError(msg)
         self._iterator = iterator
         self._count = 0
         self._limit = limit
+        self._on_limit_reached = on_limit_reached
+
+    @typing_extensions.override
+    async def aclose(self) -> None:
+        await self._iterator.aclose()
 
     @typing_extensions.override
     async def __anext__(self) -> ValueT:
         if self._count >= self._limit:
+            if self._on_limit_reached is not None:
+                self._on_limit_reached()
+
             self._complete()
 
         next_item = await self._iterator.__anext__()
@@ -890,6 +975,10 @@ def __init__(self, iterator: LazyIterator[ValueT], number: int) -> None:
         self._count = 0
         self._number = number
 
+    @typing_extensions.override
+    async def aclose(self) -> None:
+        await self._iterator.aclose()
+
     @typing_extensions.override
     async def __anext__(self) -> ValueT:
         while self._count < self._number:
@@ -906,6 +995,10 @@ def __init__(self, iterator: LazyIterator[ValueT], predicate: typing.Callable[[V
         self._iterator = iterator
         self._predicate = predicate
 
+    @typing_extensions.override
+    async def aclose(self) -> None:
+        await self._iterator.aclose()
+
     @typing_extensions.override
     async def __anext__(self) -> ValueT:
         async for item in self._iterator:
@@ -922,6 +1015,10 @@ def __init__(self, iterator: LazyIterator[ValueT], chunk_size: int) -> None:
         self._iterator = iterator
         self._chunk_size = chunk_size
 
+    @typing_extensions.override
+    async def aclose(self) -> None:
+        await self._iterator.aclose()
+
     @typing_extensions.override
     async def __anext__(self) -> typing.Sequence[ValueT]:
         chunk: list[ValueT] = []
@@ -945,6 +1042,12 @@ def __init__(self, iterator: LazyIterator[ValueT]) -> None:
         self._buffer: typing.MutableSequence[ValueT] = []
         self._origin: LazyIterator[ValueT] | None = iterator
 
+    @typing_extensions.override
+    async def aclose(self) -> None:
+        if self._origin is not None:
+            await self._origin.aclose()
+            self._origin = None
+
     @typing_extensions.override
     async def __anext__(self) -> ValueT:
         if self._origin is not None:
@@ -966,6 +1069,10 @@ def __init__(
         self._iterator = iterator
         self._transformation = transformation
 
+    @typing_extensions.override
+    async def aclose(self) -> None:
+        await self._iterator.aclose()
+
     @typing_extensions.override
     async def __anext__(self) -> ValueT:
         return self._transformation(await self._iterator.__anext__())
@@ -978,6 +1085,10 @@ def __init__(self, iterator: LazyIterator[ValueT], condition: typing.Callable[[V
         self._iterator = iterator
         self._condition = condition
 
+    @typing_extensions.override
+    async def aclose(self) -> None:
+        await self._iterator.aclose()
+
     @typing_extensions.override
     async def __anext__(self) -> ValueT:
         item = await self._iterator.__anext__()
@@ -996,6 +1107,10 @@ def __init__(self, iterator: LazyIterator[ValueT], condition: typing.Callable[[V
         self._condition = condition
         self._has_dropped = False
 
+    @typing_extensions.override
+    async def aclose(self) -> None:
+        await self._iterator.aclose()
+
     @typing_extensions.override
     async def __anext__(self) -> ValueT:
         if not self._has_dropped:
@@ -1024,6 +1139,10 @@ def __init__(self, iterator: LazyIterator[ValueT], flattener: _FlattenerT[ValueT
         self._flattener = flattener
         self._result_iterator: typing.AsyncIterator[AnotherValueT] | None = None
 
+    @typing_extensions.override
+    async def aclose(self) -> None:
+        await self._iterator.aclose()
+
     async def _generator(self) -> typing.AsyncIterator[AnotherValueT]:
         async for input_item in self._iterator:
             result_iterator = self._flattener(input_item)
@@ -1052,6 +1171,10 @@ def __init__(self, iterator: LazyIterator[typing.Awaitable[ValueT]], window_size
         self._window_size = float("inf") if window_size <= 0 else window_size
         self._buffer: list[ValueT] = []
 
+    @typing_extensions.override
+    async def aclose(self) -> None:
+        await self._iterator.aclose()
+
     @typing_extensions.override
     async def __anext__(self) -> ValueT:
         if not self._buffer:
@@ -211,7 +211,8 @@ async def execute(
         hikari.errors.UnauthorizedError
             If you pass a token that's invalid for the target webhook.
         ValueError
-            If `token` is not available.
+            If `token` is not available or if more than 100 unique
+            objects/entities are passed for `role_mentions` or `user_mentions`.
         TypeError
             If both `attachment` and `attachments`, `component` and `components`
             or `embed` and `embeds` are specified.
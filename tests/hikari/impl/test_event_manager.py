@@ -23,7 +23,6 @@
 import asyncio
 import base64
 import contextlib
-import random
 
 import mock
 import pytest
@@ -40,14 +39,6 @@
 from tests.hikari import hikari_test_helpers
 
 
-def test_fixed_size_nonce():
-    with (
-        mock.patch.object(time, "time_ns", return_value=1750363933884138616),
-        mock.patch.object(random, "getrandbits", return_value=3816720724214628891853616180),
-    ):
-        assert event_manager._fixed_size_nonce() == "GEqKuVrRxHgMVR4NDFaqlnpIdDQ="
-
-
 @pytest.fixture
 def shard():
     return mock.Mock(id=987)
@@ -619,7 +610,7 @@ def cache_enabled_for_members_only(component):
         mock_request_guild_members = mock.Mock()
 
         with mock.patch.object(asyncio, "create_task") as create_task:
-            with mock.patch.object(event_manager, "_fixed_size_nonce", return_value="abc"):
+            with mock.patch.object(time, "fixed_size_nonce", return_value="abc"):
                 with mock.patch.object(event_manager, "_request_guild_members", new=mock_request_guild_members):
                     event_manager_impl.on_guild_create(shard, {"id": 456, "large": False})
 
@@ -646,7 +637,7 @@ def cache_enabled_for_members_only(component):
         mock_request_guild_members = mock.Mock()
 
         with mock.patch.object(asyncio, "create_task") as create_task:
-            with mock.patch.object(event_manager, "_fixed_size_nonce", return_value="abc"):
+            with mock.patch.object(time, "fixed_size_nonce", return_value="abc"):
                 with mock.patch.object(event_manager, "_request_guild_members", new=mock_request_guild_members):
                     event_manager_impl.on_guild_create(shard, {"id": 456, "large": False})
 
@@ -667,7 +658,7 @@ def test_on_guild_create_when_members_declared_and_enabled_for_member_chunk_even
         mock_request_guild_members = mock.Mock()
 
         with mock.patch.object(asyncio, "create_task") as create_task:
-            with mock.patch.object(event_manager, "_fixed_size_nonce", return_value="abc"):
+            with mock.patch.object(time, "fixed_size_nonce", return_value="abc"):
                 with mock.patch.object(event_manager, "_request_guild_members", new=mock_request_guild_members):
                     stateless_event_manager_impl.on_guild_create(shard, {"large": True})
 
@@ -30,9 +30,11 @@
 
 from hikari import applications
 from hikari import errors
+from hikari import intents as intents_
 from hikari import presences
 from hikari import snowflakes
 from hikari import undefined
+from hikari.events import shard_events
 from hikari.impl import cache as cache_impl
 from hikari.impl import config
 from hikari.impl import entity_factory as entity_factory_impl
@@ -44,6 +46,7 @@
 from hikari.impl import voice as voice_impl
 from hikari.internal import aio
 from hikari.internal import signals
+from hikari.internal import time
 from hikari.internal import ux
 from tests.hikari import hikari_test_helpers
 
@@ -924,6 +927,120 @@ async def test_request_guild_members(self, bot):
             guild=115590097100865541, include_presences=True, query="indeed", limit=42, users=[123], nonce="NONCE"
         )
 
+    @pytest.mark.asyncio
+    async def test_fetch_members_via_gateway(self, bot, event_manager):
+        bot._intents = intents_.Intents.GUILD_MEMBERS
+        shard = mock.Mock(id=2, request_guild_members=mock.AsyncMock())
+        member_1, member_2, member_3 = mock.Mock(), mock.Mock(), mock.Mock()
+        stream = mock.MagicMock()
+        event_manager.stream.return_value.filter.return_value = stream
+        stream.__enter__.return_value.__aiter__.return_value = [
+            mock.Mock(members={1: member_1, 2: member_2}, chunk_index=0, chunk_count=2),
+            mock.Mock(members={3: member_3}, chunk_index=1, chunk_count=2),
+            mock.Mock(members={4: mock.Mock()}, chunk_index=2, chunk_count=3),
+        ]
+
+        with (
+            mock.patch.object(bot_impl.GatewayBot, "_get_shard", return_value=shard) as get_shard,
+            mock.patch.object(bot_impl.GatewayBot, "_check_if_alive") as check_if_alive,
+            mock.patch.object(time, "fixed_size_nonce", return_value="NONCE"),
+        ):
+            chunks = [chunk async for chunk in bot.fetch_members_via_gateway(123, timeout=5)]
+
+        assert chunks == [(member_1, member_2), (member_3,)]
+        check_if_alive.assert_called_once_with()
+        get_shard.assert_called_once_with(123)
+        event_manager.stream.assert_called_once_with(shard_events.MemberChunkEvent, timeout=5)
+        event_manager.stream.return_value.filter.assert_called_once_with(("nonce", "2.NONCE"))
+        shard.request_guild_members.assert_awaited_once_with(
+            guild=123, query="", limit=0, users=undefined.UNDEFINED, nonce="2.NONCE"
+        )
+
+    @pytest.mark.asyncio
+    async def test_fetch_members_via_gateway_when_timed_out(self, bot, event_manager):
+        bot._intents = intents_.Intents.GUILD_MEMBERS
+        shard = mock.Mock(id=2, request_guild_members=mock.AsyncMock())
+        member_1 = mock.Mock()
+        stream = mock.MagicMock()
+        event_manager.stream.return_value.filter.return_value = stream
+        stream.__enter__.return_value.__aiter__.return_value = [
+            mock.Mock(members={1: member_1}, chunk_index=0, chunk_count=2)
+        ]
+        chunks = []
+
+        with (
+            mock.patch.object(bot_impl.GatewayBot, "_get_shard", return_value=shard),
+            mock.patch.object(bot_impl.GatewayBot, "_check_if_alive"),
+            pytest.raises(asyncio.TimeoutError),
+        ):
+            async for chunk in bot.fetch_members_via_gateway(123, timeout=5):
+                chunks.append(chunk)
+
+        assert chunks == [(member_1,)]
+
+    @pytest.mark.asyncio
+    async def test_fetch_members_via_gateway_falls_back_to_rest_without_intent(self, bot, rest, event_manager):
+        bot._intents = intents_.Intents.NONE
+        rest.fetch_members.return_value.chunk.return_value = mock.MagicMock()
+        rest.fetch_members.return_value.chunk.return_value.__aiter__.return_value = [[1, 2], [3]]
+
+        with mock.patch.object(bot_impl.GatewayBot, "_check_if_alive"):
+            chunks = [chunk async for chunk in bot.fetch_members_via_gateway(123)]
+
+        assert chunks == [[1, 2], [3]]
+        rest.fetch_members.assert_called_once_with(123)
+        rest.fetch_members.return_value.chunk.assert_called_once_with(1000)
+        event_manager.stream.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_get_or_fetch_member_when_cached(self, bot, cache, rest):
+        rest.fetch_member = mock.AsyncMock()
+
+        assert await bot.get_or_fetch_member(123, 456) is cache.get_member.return_value
+
+        cache.get_member.assert_called_once_with(123, 456)
+        rest.fetch_member.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_get_or_fetch_member_when_not_cached(self, bot, cache, rest):
+        cache.get_member.return_value = None
+        rest.fetch_member = mock.AsyncMock()
+
+        assert await bot.get_or_fetch_member(123, 456) is rest.fetch_member.return_value
+
+        cache.get_member.assert_called_once_with(123, 456)
+        rest.fetch_member.assert_awaited_once_with(123, 456)
+
+    @pytest.mark.asyncio
+    async def test_get_or_fetch_role_when_cached(self, bot, cache, rest):
+        cache.get_role.return_value = mock.Mock(guild_id=snowflakes.Snowflake(123))
+        rest.fetch_role = mock.AsyncMock()
+
+        assert await bot.get_or_fetch_role(123, 789) is cache.get_role.return_value
+
+        cache.get_role.assert_called_once_with(789)
+        rest.fetch_role.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_get_or_fetch_role_when_cached_in_another_guild(self, bot, cache, rest):
+        cache.get_role.return_value = mock.Mock(guild_id=snowflakes.Snowflake(456))
+        rest.fetch_role = mock.AsyncMock()
+
+        assert await bot.get_or_fetch_role(123, 789) is rest.fetch_role.return_value
+
+        cache.get_role.assert_called_once_with(789)
+        rest.fetch_role.assert_awaited_once_with(123, 789)
+
+    @pytest.mark.asyncio
+    async def test_get_or_fetch_role_when_not_cached(self, bot, cache, rest):
+        cache.get_role.return_value = None
+        rest.fetch_role = mock.AsyncMock()
+
+        assert await bot.get_or_fetch_role(123, 789) is rest.fetch_role.return_value
+
+        cache.get_role.assert_called_once_with(789)
+        rest.fetch_role.assert_awaited_once_with(123, 789)
+
     @pytest.mark.asyncio
     async def test_start_one_shard(self, bot):
         activity = object()
@@ -23,6 +23,7 @@
 import asyncio
 import contextlib
 import datetime
+import gc
 import http
 import re
 import typing
@@ -682,6 +683,9 @@ def test_token_type_property(self, rest_client):
     @pytest.mark.asyncio
     async def test_close(self, rest_client, client_session_owner, bucket_manager_owner):
         rest_client._close_event = mock_close_event = mock.Mock()
+        inflight_request = mock.Mock()
+        rest_client._inflight_requests[object()] = inflight_request
+        rest_client._response_cache[routes.GET_GATEWAY] = (123.0, {"url": "wss://some.url"})
         rest_client._client_session.close = client_close = mock.AsyncMock()
         rest_client._bucket_manager.close = bucket_close = mock.AsyncMock()
         rest_client._client_session_owner = client_session_owner
@@ -691,6 +695,9 @@ async def test_close(self, rest_client, client_session_owner, bucket_manager_own
 
         mock_close_event.set.assert_called_once_with()
         assert rest_client._close_event is None
+        assert rest_client._response_cache == {}
+        assert rest_client._inflight_requests == {}
+        inflight_request.cancel.assert_called_once_with()
 
         if client_session_owner:
             client_close.assert_awaited_once_with()
@@ -704,6 +711,13 @@ async def test_close(self, rest_client, client_session_owner, bucket_manager_own
         else:
             rest_client._bucket_manager.assert_not_called()
 
+    def test_clear_response_cache(self, rest_client):
+        rest_client._response_cache[routes.GET_GATEWAY] = (123.0, {"url": "wss://some.url"})
+
+        rest_client.clear_response_cache()
+
+        assert rest_client._response_cache == {}
+
     @pytest.mark.parametrize("client_session_owner", [True, False])
     @pytest.mark.parametrize("bucket_manager_owner", [True, False])
     @pytest.mark.asyncio  # Function needs to be executed in a running loop
@@ -882,6 +896,7 @@ def test_fetch_my_guilds_when_start_at_is_undefined(self, rest_client):
                 request_call=rest_client._request,
                 newest_first=False,
                 first_id="0",
+                prefetch=False,
             )
 
     def test_fetch_my_guilds_when_start_at_is_datetime(self, rest_client):
@@ -896,6 +911,7 @@ def test_fetch_my_guilds_when_start_at_is_datetime(self, rest_client):
                 request_call=rest_client._request,
                 newest_first=False,
                 first_id="735757641938108416",
+                prefetch=False,
             )
 
     def test_fetch_my_guilds_when_start_at_is_else(self, rest_client):
@@ -909,6 +925,21 @@ def test_fetch_my_guilds_when_start_at_is_else(self, rest_client):
                 request_call=rest_client._request,
                 newest_first=True,
                 first_id="123",
+                prefetch=False,
+            )
+
+    def test_fetch_my_guilds_with_prefetch(self, rest_client):
+        stub_iterator = mock.Mock()
+
+        with mock.patch.object(special_endpoints, "OwnGuildIterator", return_value=stub_iterator) as iterator:
+            assert rest_client.fetch_my_guilds(prefetch=True) == stub_iterator
+
+            iterator.assert_called_once_with(
+                entity_factory=rest_client._entity_factory,
+                request_call=rest_client._request,
+                newest_first=False,
+                first_id="0",
+                prefetch=True,
             )
 
     def test_fetch_audit_log_when_before_is_undefined(self, rest_client):
@@ -925,6 +956,7 @@ def test_fetch_audit_log_when_before_is_undefined(self, rest_client):
                 before=undefined.UNDEFINED,
                 user=undefined.UNDEFINED,
                 action_type=undefined.UNDEFINED,
+                prefetch=False,
             )
 
     def test_fetch_audit_log_when_before_datetime(self, rest_client):
@@ -946,6 +978,7 @@ def test_fetch_audit_log_when_before_datetime(self, rest_client):
                 before="735757641938108416",
                 user=user,
                 action_type=audit_logs.AuditLogEventType.GUILD_UPDATE,
+                prefetch=False,
             )
 
     def test_fetch_audit_log_when_before_is_else(self, rest_client):
@@ -953,7 +986,7 @@ def test_fetch_audit_log_when_before_is_else(self, rest_client):
         stub_iterator = mock.Mock()
 
         with mock.patch.object(special_endpoints, "AuditLogIterator", return_value=stub_iterator) as iterator:
-            assert rest_client.fetch_audit_log(guild, before=StubModel(456)) == stub_iterator
+            assert rest_client.fetch_audit_log(guild, before=StubModel(456), prefetch=True) == stub_iterator
 
             iterator.assert_called_once_with(
                 entity_factory=rest_client._entity_factory,
@@ -962,12 +995,13 @@ def test_fetch_audit_log_when_before_is_else(self, rest_client):
                 before="456",
                 user=undefined.UNDEFINED,
                 action_type=undefined.UNDEFINED,
+                prefetch=True,
             )
 
     def test_fetch_public_archived_threads(self, rest_client: rest.RESTClientImpl):
         mock_datetime = time.utc_datetime()
         with mock.patch.object(special_endpoints, "GuildThreadIterator") as iterator:
-            result = rest_client.fetch_public_archived_threads(StubModel(54123123), before=mock_datetime)
+            result = rest_client.fetch_public_archived_threads(StubModel(54123123), before=mock_datetime, prefetch=True)
 
         assert result is iterator.return_value
         iterator.assert_called_once_with(
@@ -977,6 +1011,7 @@ def test_fetch_public_archived_threads(self, rest_client: rest.RESTClientImpl):
             route=routes.GET_PUBLIC_ARCHIVED_THREADS.compile(channel=54123123),
             before=mock_datetime.isoformat(),
             before_is_timestamp=True,
+            prefetch=True,
         )
 
     def test_fetch_public_archived_threads_when_before_not_specified(self, rest_client: rest.RESTClientImpl):
@@ -991,6 +1026,7 @@ def test_fetch_public_archived_threads_when_before_not_specified(self, rest_clie
             route=routes.GET_PUBLIC_ARCHIVED_THREADS.compile(channel=432234),
             before=undefined.UNDEFINED,
             before_is_timestamp=True,
+            prefetch=False,
         )
 
     def test_fetch_private_archived_threads(self, rest_client: rest.RESTClientImpl):
@@ -1006,6 +1042,7 @@ def test_fetch_private_archived_threads(self, rest_client: rest.RESTClientImpl):
             route=routes.GET_PRIVATE_ARCHIVED_THREADS.compile(channel=432234432),
             before=mock_datetime.isoformat(),
             before_is_timestamp=True,
+            prefetch=False,
         )
 
     def test_fetch_private_archived_threads_when_before_not_specified(self, rest_client: rest.RESTClientImpl):
@@ -1020,6 +1057,7 @@ def test_fetch_private_archived_threads_when_before_not_specified(self, rest_cli
             route=routes.GET_PRIVATE_ARCHIVED_THREADS.compile(channel=543345543),
             before=undefined.UNDEFINED,
             before_is_timestamp=True,
+            prefetch=False,
         )
 
     @pytest.mark.parametrize(
@@ -1039,6 +1077,7 @@ def test_fetch_joined_private_archived_threads(
             route=routes.GET_JOINED_PRIVATE_ARCHIVED_THREADS.compile(channel=543123),
             before="947809989634818048",
             before_is_timestamp=False,
+            prefetch=False,
         )
 
     def test_fetch_joined_private_archived_threads_when_before_not_specified(self, rest_client: rest.RESTClientImpl):
@@ -1053,6 +1092,7 @@ def test_fetch_joined_private_archived_threads_when_before_not_specified(self, r
             route=routes.GET_JOINED_PRIVATE_ARCHIVED_THREADS.compile(channel=323232),
             before=undefined.UNDEFINED,
             before_is_timestamp=False,
+            prefetch=False,
         )
 
     def test_fetch_members(self, rest_client):
@@ -1068,6 +1108,7 @@ def test_fetch_members(self, rest_client):
                 guild=guild,
                 after=undefined.UNDEFINED,
                 limit=undefined.UNDEFINED,
+                prefetch=False,
             )
 
     def test_kick_member(self, rest_client):
@@ -1099,10 +1140,15 @@ def test_unban_member(self, rest_client):
 
     def test_fetch_bans(self, rest_client: rest.RESTClientImpl):
         with mock.patch.object(special_endpoints, "GuildBanIterator") as iterator_cls:
-            iterator = rest_client.fetch_bans(187, newest_first=True, start_at=StubModel(65652342134))
+            iterator = rest_client.fetch_bans(187, newest_first=True, start_at=StubModel(65652342134), prefetch=True)
 
         iterator_cls.assert_called_once_with(
-            rest_client._entity_factory, rest_client._request, 187, newest_first=True, first_id="65652342134"
+            rest_client._entity_factory,
+            rest_client._request,
+            187,
+            newest_first=True,
+            first_id="65652342134",
+            prefetch=True,
         )
         assert iterator is iterator_cls.return_value
 
@@ -1112,7 +1158,12 @@ def test_fetch_bans_when_datetime_for_start_at(self, rest_client: rest.RESTClien
             iterator = rest_client.fetch_bans(9000, newest_first=True, start_at=start_at)
 
         iterator_cls.assert_called_once_with(
-            rest_client._entity_factory, rest_client._request, 9000, newest_first=True, first_id="950000286338908160"
+            rest_client._entity_factory,
+            rest_client._request,
+            9000,
+            newest_first=True,
+            first_id="950000286338908160",
+            prefetch=False,
         )
         assert iterator is iterator_cls.return_value
 
@@ -1126,6 +1177,7 @@ def test_fetch_bans_when_start_at_undefined(self, rest_client: rest.RESTClientIm
             8844,
             newest_first=False,
             first_id=str(snowflakes.Snowflake.min()),
+            prefetch=False,
         )
         assert iterator is iterator_cls.return_value
 
@@ -1139,6 +1191,7 @@ def test_fetch_bans_when_start_at_undefined_and_newest_first(self, rest_client:
             3848,
             newest_first=True,
             first_id=str(snowflakes.Snowflake.max()),
+            prefetch=False,
         )
         assert iterator is iterator_cls.return_value
 
@@ -3627,6 +3680,52 @@ async def test_execute_webhook_when_no_form(self, rest_client):
         )
         rest_client._entity_factory.deserialize_message.assert_called_once_with({"message_id": 123})
 
+    async def test_execute_webhook_when_async_iterable_attachments(self, rest_client):
+        attachment_obj = object()
+        attachment_obj2 = object()
+        mock_body = data_binding.JSONObjectBuilder()
+        expected_route = routes.POST_WEBHOOK_WITH_TOKEN.compile(webhook=432, token="hi, im a token")
+        rest_client._build_message_payload = mock.Mock(return_value=(mock_body, None))
+        rest_client._request = mock.AsyncMock(return_value={"message_id": 123})
+
+        async def attachment_generator():
+            yield attachment_obj
+            yield attachment_obj2
+
+        await rest_client.execute_webhook(432, "hi, im a token", attachments=attachment_generator())
+
+        rest_client._build_message_payload.assert_called_once_with(
+            content=undefined.UNDEFINED,
+            attachment=undefined.UNDEFINED,
+            attachments=[attachment_obj, attachment_obj2],
+            component=undefined.UNDEFINED,
+            components=undefined.UNDEFINED,
+            embed=undefined.UNDEFINED,
+            embeds=undefined.UNDEFINED,
+            poll=undefined.UNDEFINED,
+            tts=undefined.UNDEFINED,
+            flags=undefined.UNDEFINED,
+            mentions_everyone=undefined.UNDEFINED,
+            user_mentions=undefined.UNDEFINED,
+            role_mentions=undefined.UNDEFINED,
+        )
+
+    async def test_execute_webhook_when_async_iterable_attachments_raises(self, rest_client):
+        error = RuntimeError("ded")
+        rest_client._build_message_payload = mock.Mock()
+        rest_client._request = mock.AsyncMock()
+
+        async def attachment_generator():
+            yield object()
+            raise error
+
+        with pytest.raises(RuntimeError) as exc_info:
+            await rest_client.execute_webhook(432, "hi, im a token", attachments=attachment_generator())
+
+        assert exc_info.value is error
+        rest_client._build_message_payload.assert_not_called()
+        rest_client._request.assert_not_called()
+
     async def test_execute_webhook_when_thread_and_no_form(self, rest_client):
         attachment_obj = object()
         attachment_obj2 = object()
@@ -3871,6 +3970,53 @@ async def test_edit_webhook_message_when_no_form(self, rest_client: rest_api.RES
         )
         rest_client._entity_factory.deserialize_message.assert_called_once_with({"message_id": 123})
 
+    async def test_edit_webhook_message_when_async_iterable_attachments(self, rest_client: rest_api.RESTClient):
+        attachment_obj = object()
+        attachment_obj2 = object()
+        mock_body = data_binding.JSONObjectBuilder()
+        rest_client._build_message_payload = mock.Mock(return_value=(mock_body, None))
+        rest_client._request = mock.AsyncMock(return_value={"message_id": 123})
+
+        async def attachment_generator():
+            yield attachment_obj
+            yield attachment_obj2
+
+        await rest_client.edit_webhook_message(
+            432, "hi, im a token", StubModel(456), attachments=attachment_generator()
+        )
+
+        rest_client._build_message_payload.assert_called_once_with(
+            content=undefined.UNDEFINED,
+            attachment=undefined.UNDEFINED,
+            attachments=[attachment_obj, attachment_obj2],
+            component=undefined.UNDEFINED,
+            components=undefined.UNDEFINED,
+            embed=undefined.UNDEFINED,
+            embeds=undefined.UNDEFINED,
+            mentions_everyone=undefined.UNDEFINED,
+            user_mentions=undefined.UNDEFINED,
+            role_mentions=undefined.UNDEFINED,
+            edit=True,
+        )
+
+    async def test_edit_webhook_message_when_async_iterable_attachments_raises(self, rest_client: rest_api.RESTClient):
+        error = RuntimeError("ded")
+        rest_client._build_message_payload = mock.Mock()
+        rest_client._request = mock.AsyncMock()
+
+        async def attachment_generator():
+            yield object()
+            raise error
+
+        with pytest.raises(RuntimeError) as exc_info:
+            await rest_client.edit_webhook_message(
+                432, "hi, im a token", StubModel(456), attachments=attachment_generator()
+            )
+
+        assert exc_info.value is error
+        rest_client._build_message_payload.assert_not_called()
+        rest_client._request.assert_not_called()
+
     async def test_edit_webhook_message_when_thread_and_no_form(self, rest_client: rest_api.RESTClient):
         mock_body = data_binding.JSONObjectBuilder()
         mock_body.put("testing", "ensure_in_test")
@@ -3921,13 +4067,222 @@ async def test_delete_webhook_message_when_thread(self, rest_client):
 
         rest_client._request.assert_awaited_once_with(expected_route, auth=None, query={"thread_id": "432123"})
 
+    async def test_delete_webhook_messages(self, rest_client):
+        rest_client._request = mock.AsyncMock()
+
+        await rest_client.delete_webhook_messages(123, "token", (StubModel(i) for i in range(3)))
+
+        rest_client._request.assert_has_awaits(
+            [
+                mock.call(
+                    routes.DELETE_WEBHOOK_MESSAGE.compile(webhook=123, token="token", message=i), auth=None, query={}
+                )
+                for i in range(3)
+            ]
+        )
+
+    async def test_delete_webhook_messages_with_async_iterable_and_thread(self, rest_client):
+        iterator = iterators.FlatLazyIterator([StubModel(456), StubModel(789)])
+        rest_client._request = mock.AsyncMock()
+
+        await rest_client.delete_webhook_messages(123, "token", iterator, thread=StubModel(432123))
+
+        rest_client._request.assert_has_awaits(
+            [
+                mock.call(
+                    routes.DELETE_WEBHOOK_MESSAGE.compile(webhook=123, token="token", message=456),
+                    auth=None,
+                    query={"thread_id": "432123"},
+                ),
+                mock.call(
+                    routes.DELETE_WEBHOOK_MESSAGE.compile(webhook=123, token="token", message=789),
+                    auth=None,
+                    query={"thread_id": "432123"},
+                ),
+            ]
+        )
+
+    async def test_delete_webhook_messages_when_message_not_found(self, rest_client):
+        rest_client._request = mock.AsyncMock(
+            side_effect=[None, errors.NotFoundError(url="", headers={}, raw_body="", code=10008), None]
+        )
+
+        await rest_client.delete_webhook_messages(123, "token", [StubModel(1), StubModel(2), StubModel(3)])
+
+        assert rest_client._request.await_count == 3
+
+    async def test_delete_webhook_messages_when_exception(self, rest_client):
+        messages = [StubModel(1), StubModel(2), StubModel(3)]
+        mock_not_found = errors.NotFoundError(url="", headers={}, raw_body="", code=10015)
+        rest_client._request = mock.AsyncMock(side_effect=[None, mock_not_found])
+
+        with pytest.raises(errors.BulkDeleteError) as exc_info:
+            await rest_client.delete_webhook_messages(123, "token", messages)
+
+        assert exc_info.value.__cause__ is mock_not_found
+        assert exc_info.value.deleted_messages == [messages[0]]
+        assert rest_client._request.await_count == 2
+
     async def test_fetch_gateway_url(self, rest_client):
         expected_route = routes.GET_GATEWAY.compile()
         rest_client._request = mock.AsyncMock(return_value={"url": "wss://some.url"})
 
         assert await rest_client.fetch_gateway_url() == "wss://some.url"
 
-        rest_client._request.assert_awaited_once_with(expected_route, auth=None)
+        rest_client._request.assert_awaited_once_with(expected_route, query=None, auth=None)
+
+    async def test_fetch_gateway_url_when_cached(self, rest_client):
+        rest_client._request = mock.AsyncMock(return_value={"url": "wss://some.url"})
+
+        assert await rest_client.fetch_gateway_url() == "wss://some.url"
+        assert await rest_client.fetch_gateway_url() == "wss://some.url"
+
+        rest_client._request.assert_awaited_once()
+
+    async def test__request_cached_when_not_cached(self, rest_client):
+        route = routes.GET_VOICE_REGIONS.compile()
+        rest_client._request = mock.AsyncMock(return_value=[{"id": "123"}])
+
+        with mock.patch.object(time, "time", return_value=100.0):
+            assert await rest_client._request_cached(route, ttl=50.0, auth=None) == [{"id": "123"}]
+
+        rest_client._request.assert_awaited_once_with(route, query=None, auth=None)
+        assert rest_client._response_cache == {route.route: (150.0, [{"id": "123"}])}
+
+    async def test__request_cached_when_cached(self, rest_client):
+        route = routes.GET_VOICE_REGIONS.compile()
+        rest_client._request = mock.AsyncMock()
+        rest_client._response_cache[route.route] = (150.0, [{"id": "123"}])
+
+        with mock.patch.object(time, "time", return_value=149.0):
+            assert await rest_client._request_cached(route, ttl=50.0) == [{"id": "123"}]
+
+        rest_client._request.assert_not_called()
+
+    async def test__request_cached_when_expired(self, rest_client):
+        route = routes.GET_VOICE_REGIONS.compile()
+        rest_client._request = mock.AsyncMock(return_value=[{"id": "456"}])
+        rest_client._response_cache[route.route] = (150.0, [{"id": "123"}])
+
+        with mock.patch.object(time, "time", return_value=150.0):
+            assert await rest_client._request_cached(route, ttl=50.0) == [{"id": "456"}]
+
+        rest_client._request.assert_awaited_once_with(route, query=None, auth=undefined.UNDEFINED)
+        assert rest_client._response_cache == {route.route: (200.0, [{"id": "456"}])}
+
+    async def test__request_shared(self, rest_client):
+        route = routes.GET_GUILD_PREVIEW.compile(guild=123)
+        event = asyncio.Event()
+
+        async def request(*args, **kwargs):
+            await event.wait()
+            return {"id": "123"}
+
+        rest_client._request = mock.AsyncMock(side_effect=request)
+
+        first = asyncio.create_task(rest_client._request_shared(route))
+        second = asyncio.create_task(rest_client._request_shared(route))
+        await asyncio.sleep(0)
+        event.set()
+
+        assert await first == {"id": "123"}
+        assert await second == {"id": "123"}
+        rest_client._request.assert_awaited_once_with(route, query=None, auth=undefined.UNDEFINED)
+        assert rest_client._inflight_requests == {}
+
+    async def test__request_shared_when_different_query(self, rest_client):
+        route = routes.GET_GUILD.compile(guild=123)
+        query_1 = data_binding.StringMapBuilder()
+        query_1.put("with_counts", True)
+        query_2 = data_binding.StringMapBuilder()
+        query_2.put("with_counts", False)
+        rest_client._request = mock.AsyncMock(return_value={"id": "123"})
+
+        await asyncio.gather(
+            rest_client._request_shared(route, query=query_1), rest_client._request_shared(route, query=query_2)
+        )
+
+        rest_client._request.assert_has_awaits(
+            [
+                mock.call(route, query=query_1, auth=undefined.UNDEFINED),
+                mock.call(route, query=query_2, auth=undefined.UNDEFINED),
+            ]
+        )
+
+    async def test__request_shared_when_caller_cancelled(self, rest_client):
+        route = routes.GET_GUILD_PREVIEW.compile(guild=123)
+        event = asyncio.Event()
+
+        async def request(*args, **kwargs):
+            await event.wait()
+            return {"id": "123"}
+
+        rest_client._request = mock.AsyncMock(side_effect=request)
+
+        first = asyncio.create_task(rest_client._request_shared(route))
+        second = asyncio.create_task(rest_client._request_shared(route))
+        await asyncio.sleep(0)
+        first.cancel()
+        await asyncio.sleep(0)
+        event.set()
+
+        assert await second == {"id": "123"}
+        assert first.cancelled()
+        rest_client._request.assert_awaited_once()
+
+    async def test__request_shared_when_client_closed(self, rest_client):
+        route = routes.GET_GUILD_PREVIEW.compile(guild=123)
+        rest_client._close_event = mock.Mock()
+        rest_client._client_session.close = mock.AsyncMock()
+        rest_client._bucket_manager.close = mock.AsyncMock()
+
+        async def request(*args, **kwargs):
+            await asyncio.Event().wait()
+
+        rest_client._request = mock.AsyncMock(side_effect=request)
+
+        first = asyncio.create_task(rest_client._request_shared(route))
+        second = asyncio.create_task(rest_client._request_shared(route))
+        # Once for the callers to start the shared request, and once for it to be made.
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        await rest_client.close()
+
+        for caller in (first, second):
+            with pytest.raises(errors.ComponentStateConflictError, match=r"Cannot use an inactive REST client"):
+                await caller
+
+        rest_client._request.assert_awaited_once()
+
+    async def test__request_shared_when_all_callers_cancelled_and_request_fails(self, rest_client):
+        route = routes.GET_GUILD_PREVIEW.compile(guild=123)
+        event = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        exception_handler = mock.Mock()
+        loop.set_exception_handler(exception_handler)
+
+        async def request(*args, **kwargs):
+            await event.wait()
+            raise RuntimeError("ded")
+
+        rest_client._request = mock.AsyncMock(side_effect=request)
+        caller = asyncio.create_task(rest_client._request_shared(route))
+        await asyncio.sleep(0)
+        (request_task,) = rest_client._inflight_requests.values()
+
+        try:
+            caller.cancel()
+            await asyncio.sleep(0)
+            event.set()
+            await asyncio.wait([request_task])
+            del request_task
+            gc.collect()
+        finally:
+            loop.set_exception_handler(None)
+
+        assert caller.cancelled()
+        assert rest_client._inflight_requests == {}
+        exception_handler.assert_not_called()
 
     async def test_fetch_gateway_bot(self, rest_client):
         bot = StubModel(123)
@@ -4087,6 +4442,22 @@ async def test_create_dm_channel_when_cacheless(self, rest_client, mock_cache):
         rest_client._entity_factory.deserialize_dm.assert_called_once_with({"id": "43234"})
         mock_cache.set_dm_channel_id.assert_not_called()
 
+    async def test_create_dm_channels(self, rest_client):
+        dm_channel_1 = StubModel(43234)
+        dm_channel_2 = StubModel(54123)
+        rest_client.create_dm_channel = mock.AsyncMock(side_effect=[dm_channel_1, dm_channel_2])
+
+        assert await rest_client.create_dm_channels([StubModel(123), 456]) == [dm_channel_1, dm_channel_2]
+
+        rest_client.create_dm_channel.assert_has_awaits([mock.call(StubModel(123)), mock.call(456)])
+
+    async def test_create_dm_channels_when_empty(self, rest_client):
+        rest_client.create_dm_channel = mock.AsyncMock()
+
+        assert await rest_client.create_dm_channels([]) == []
+
+        rest_client.create_dm_channel.assert_not_called()
+
     async def test_fetch_application(self, rest_client):
         application = StubModel(123)
         expected_route = routes.GET_MY_APPLICATION.compile()
@@ -4275,7 +4646,7 @@ async def test_fetch_voice_regions(self, rest_client):
 
         assert await rest_client.fetch_voice_regions() == [voice_region1, voice_region2]
 
-        rest_client._request.assert_awaited_once_with(expected_route)
+        rest_client._request.assert_awaited_once_with(expected_route, query=None, auth=undefined.UNDEFINED)
         assert rest_client._entity_factory.deserialize_voice_region.call_count == 2
         rest_client._entity_factory.deserialize_voice_region.assert_has_calls(
             [mock.call({"id": "123"}), mock.call({"id": "456"})]
@@ -4300,7 +4671,7 @@ async def test_fetch_emoji(self, rest_client):
 
         assert await rest_client.fetch_emoji(StubModel(123), StubModel(456)) is emoji
 
-        rest_client._request.assert_awaited_once_with(expected_route)
+        rest_client._request.assert_awaited_once_with(expected_route, query=None, auth=undefined.UNDEFINED)
         rest_client._entity_factory.deserialize_known_custom_emoji.assert_called_once_with({"id": "456"}, guild_id=123)
 
     async def test_fetch_guild_emojis(self, rest_client):
@@ -4434,11 +4805,21 @@ async def test_fetch_sticker_packs(self, rest_client):
 
         assert await rest_client.fetch_available_sticker_packs() == [pack1, pack2, pack3]
 
-        rest_client._request.assert_awaited_once_with(expected_route, auth=None)
+        rest_client._request.assert_awaited_once_with(expected_route, query=None, auth=None)
         rest_client._entity_factory.deserialize_sticker_pack.assert_has_calls(
             [mock.call({"id": "123"}), mock.call({"id": "456"}), mock.call({"id": "789"})]
         )
 
+    async def test_fetch_available_sticker_packs_when_cached(self, rest_client):
+        rest_client._request = mock.AsyncMock(return_value={"sticker_packs": [{"id": "123"}]})
+        rest_client._entity_factory.deserialize_sticker_pack = mock.Mock()
+
+        await rest_client.fetch_available_sticker_packs()
+        await rest_client.fetch_available_sticker_packs()
+
+        rest_client._request.assert_awaited_once()
+        assert rest_client._entity_factory.deserialize_sticker_pack.call_count == 2
+
     async def test_fetch_sticker_when_guild_sticker(self, rest_client):
         expected_route = routes.GET_STICKER.compile(sticker=123)
         rest_client._request = mock.AsyncMock(return_value={"id": "123", "guild_id": "456"})
@@ -4447,7 +4828,7 @@ async def test_fetch_sticker_when_guild_sticker(self, rest_client):
         returned = await rest_client.fetch_sticker(StubModel(123))
         assert returned is rest_client._entity_factory.deserialize_guild_sticker.return_value
 
-        rest_client._request.assert_awaited_once_with(expected_route)
+        rest_client._request.assert_awaited_once_with(expected_route, query=None, auth=undefined.UNDEFINED)
         rest_client._entity_factory.deserialize_guild_sticker.assert_called_once_with({"id": "123", "guild_id": "456"})
 
     async def test_fetch_sticker_when_standard_sticker(self, rest_client):
@@ -4458,7 +4839,7 @@ async def test_fetch_sticker_when_standard_sticker(self, rest_client):
         returned = await rest_client.fetch_sticker(StubModel(123))
         assert returned is rest_client._entity_factory.deserialize_standard_sticker.return_value
 
-        rest_client._request.assert_awaited_once_with(expected_route)
+        rest_client._request.assert_awaited_once_with(expected_route, query=None, auth=undefined.UNDEFINED)
         rest_client._entity_factory.deserialize_standard_sticker.assert_called_once_with({"id": "123"})
 
     async def test_fetch_guild_stickers(self, rest_client):
@@ -4543,7 +4924,7 @@ async def test_fetch_guild(self, rest_client):
 
         assert await rest_client.fetch_guild(StubModel(123)) is guild
 
-        rest_client._request.assert_awaited_once_with(expected_route, query=expected_query)
+        rest_client._request.assert_awaited_once_with(expected_route, query=expected_query, auth=undefined.UNDEFINED)
         rest_client._entity_factory.deserialize_rest_guild.assert_called_once_with({"id": "1234"})
 
     async def test_fetch_guild_preview(self, rest_client):
@@ -4554,7 +4935,7 @@ async def test_fetch_guild_preview(self, rest_client):
 
         assert await rest_client.fetch_guild_preview(StubModel(123)) is guild_preview
 
-        rest_client._request.assert_awaited_once_with(expected_route)
+        rest_client._request.assert_awaited_once_with(expected_route, query=None, auth=undefined.UNDEFINED)
         rest_client._entity_factory.deserialize_guild_preview.assert_called_once_with({"id": "1234"})
 
     async def test_delete_guild(self, rest_client):
@@ -5370,6 +5751,37 @@ async def test_add_thread_member(self, rest_client: rest.RESTClientImpl):
 
         rest_client._request.assert_awaited_once_with(routes.PUT_THREAD_MEMBER.compile(channel=789, user=666))
 
+    async def test_add_thread_members(self, rest_client: rest.RESTClientImpl):
+        rest_client.add_thread_member = mock.AsyncMock()
+        channel = StubModel(789)
+
+        await rest_client.add_thread_members(channel, [StubModel(666), 777, StubModel(777), 666])
+
+        rest_client.add_thread_member.assert_has_awaits([mock.call(channel, 666), mock.call(channel, 777)])
+        assert rest_client.add_thread_member.await_count == 2
+
+    async def test_add_thread_members_limits_concurrency(self, rest_client: rest.RESTClientImpl):
+        in_flight = 0
+        max_in_flight = 0
+
+        async def add_thread_member(channel, user):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+
+        rest_client.add_thread_member = mock.AsyncMock(side_effect=add_thread_member)
+
+        await rest_client.add_thread_members(StubModel(789), range(10), concurrency=3)
+
+        assert rest_client.add_thread_member.await_count == 10
+        assert max_in_flight == 3
+
+    async def test_add_thread_members_when_concurrency_is_invalid(self, rest_client: rest.RESTClientImpl):
+        with pytest.raises(ValueError, match=r"'concurrency' must be greater than 0"):
+            await rest_client.add_thread_members(StubModel(789), [123], concurrency=0)
+
     async def test_leave_thread(self, rest_client: rest.RESTClientImpl):
         rest_client._request = mock.AsyncMock()
 
@@ -5384,6 +5796,37 @@ async def test_remove_thread_member(self, rest_client: rest.RESTClientImpl):
 
         rest_client._request.assert_awaited_once_with(routes.DELETE_THREAD_MEMBER.compile(channel=669, user=421))
 
+    async def test_remove_thread_members(self, rest_client: rest.RESTClientImpl):
+        rest_client.remove_thread_member = mock.AsyncMock()
+        channel = StubModel(669)
+
+        await rest_client.remove_thread_members(channel, [StubModel(421), 123, 421])
+
+        rest_client.remove_thread_member.assert_has_awaits([mock.call(channel, 421), mock.call(channel, 123)])
+        assert rest_client.remove_thread_member.await_count == 2
+
+    async def test_remove_thread_members_limits_concurrency(self, rest_client: rest.RESTClientImpl):
+        in_flight = 0
+        max_in_flight = 0
+
+        async def remove_thread_member(channel, user):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+
+        rest_client.remove_thread_member = mock.AsyncMock(side_effect=remove_thread_member)
+
+        await rest_client.remove_thread_members(StubModel(669), range(10), concurrency=3)
+
+        assert rest_client.remove_thread_member.await_count == 10
+        assert max_in_flight == 3
+
+    async def test_remove_thread_members_when_concurrency_is_invalid(self, rest_client: rest.RESTClientImpl):
+        with pytest.raises(ValueError, match=r"'concurrency' must be greater than 0"):
+            await rest_client.remove_thread_members(StubModel(669), [123], concurrency=0)
+
     async def test_fetch_thread_member(self, rest_client: rest.RESTClientImpl):
         rest_client._request = mock.AsyncMock(return_value={"id": "9239292", "user_id": "949494"})
 
@@ -5391,7 +5834,9 @@ async def test_fetch_thread_member(self, rest_client: rest.RESTClientImpl):
 
         assert result is rest_client.entity_factory.deserialize_thread_member.return_value
         rest_client.entity_factory.deserialize_thread_member.assert_called_once_with(rest_client._request.return_value)
-        rest_client._request.assert_awaited_once_with(routes.GET_THREAD_MEMBER.compile(channel=55445454, user=45454454))
+        rest_client._request.assert_awaited_once_with(
+            routes.GET_THREAD_MEMBER.compile(channel=55445454, user=45454454), query=None, auth=undefined.UNDEFINED
+        )
 
     async def test_fetch_thread_members(self, rest_client: rest.RESTClientImpl):
         mock_payload_1 = mock.Mock()
@@ -5408,7 +5853,9 @@ async def test_fetch_thread_members(self, rest_client: rest.RESTClientImpl):
         result = await rest_client.fetch_thread_members(StubModel(110101010101))
 
         assert result == [mock_member_1, mock_member_2, mock_member_3]
-        rest_client._request.assert_awaited_once_with(routes.GET_THREAD_MEMBERS.compile(channel=110101010101))
+        rest_client._request.assert_awaited_once_with(
+            routes.GET_THREAD_MEMBERS.compile(channel=110101010101), query=None, auth=undefined.UNDEFINED
+        )
         rest_client._entity_factory.deserialize_thread_member.assert_has_calls(
             [mock.call(mock_payload_1), mock.call(mock_payload_2), mock.call(mock_payload_3)]
         )
@@ -5445,6 +5892,66 @@ async def test_fetch_member(self, rest_client):
         rest_client._request.assert_awaited_once_with(expected_route)
         rest_client._entity_factory.deserialize_member.assert_called_once_with({"id": "789"}, guild_id=123)
 
+    async def test_fetch_members_bulk(self, rest_client):
+        member_1 = mock.Mock()
+        member_2 = mock.Mock()
+        guild = StubModel(123)
+
+        async def fetch_member(guild, user):
+            if user == 666:
+                raise errors.NotFoundError(url="", headers={}, raw_body="", code=10013)
+            if user == 777:
+                raise errors.NotFoundError(url="", headers={}, raw_body="", code=10007)
+
+            return member_1 if user == 456 else member_2
+
+        rest_client.fetch_member = mock.AsyncMock(side_effect=fetch_member)
+
+        result = await rest_client.fetch_members_bulk(guild, [StubModel(456), 789, 666, 777, 456], concurrency=2)
+
+        assert result == {456: member_1, 789: member_2}
+        rest_client.fetch_member.assert_has_awaits(
+            [mock.call(guild, 456), mock.call(guild, 789), mock.call(guild, 666), mock.call(guild, 777)], any_order=True
+        )
+        assert rest_client.fetch_member.await_count == 4
+
+    async def test_fetch_members_bulk_limits_concurrency(self, rest_client):
+        in_flight = 0
+        max_in_flight = 0
+
+        async def fetch_member(guild, user):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return mock.Mock()
+
+        rest_client.fetch_member = mock.AsyncMock(side_effect=fetch_member)
+
+        result = await rest_client.fetch_members_bulk(StubModel(123), range(10), concurrency=3)
+
+        assert len(result) == 10
+        assert max_in_flight == 3
+
+    async def test_fetch_members_bulk_propagates_other_errors(self, rest_client):
+        rest_client.fetch_member = mock.AsyncMock(side_effect=errors.ForbiddenError(url="", headers={}, raw_body=""))
+
+        with pytest.raises(errors.ForbiddenError):
+            await rest_client.fetch_members_bulk(StubModel(123), [456])
+
+    async def test_fetch_members_bulk_when_guild_not_found(self, rest_client):
+        rest_client.fetch_member = mock.AsyncMock(
+            side_effect=errors.NotFoundError(url="", headers={}, raw_body="", code=10004)
+        )
+
+        with pytest.raises(errors.NotFoundError):
+            await rest_client.fetch_members_bulk(StubModel(123), [456])
+
+    async def test_fetch_members_bulk_when_concurrency_is_invalid(self, rest_client):
+        with pytest.raises(ValueError, match=r"'concurrency' must be greater than 0"):
+            await rest_client.fetch_members_bulk(StubModel(123), [456], concurrency=0)
+
     async def test_fetch_my_member(self, rest_client):
         expected_route = routes.GET_MY_GUILD_MEMBER.compile(guild=45123)
         rest_client._request = mock.AsyncMock(return_value={"id": "595995"})
@@ -5467,7 +5974,7 @@ async def test_search_members(self, rest_client):
         assert await rest_client.search_members(StubModel(645234123), "a name") == [member]
 
         rest_client._entity_factory.deserialize_member.assert_called_once_with({"id": "764435"}, guild_id=645234123)
-        rest_client._request.assert_awaited_once_with(expected_route, query=expected_query)
+        rest_client._request.assert_awaited_once_with(expected_route, query=expected_query, auth=undefined.UNDEFINED)
 
     async def test_edit_member(self, rest_client):
         expected_route = routes.PATCH_GUILD_MEMBER.compile(guild=123, user=456)
@@ -5592,6 +6099,44 @@ async def test_remove_role_from_member(self, rest_client):
 
         rest_client._request.assert_awaited_once_with(expected_route, reason="because i can")
 
+    async def test_set_member_roles(self, rest_client):
+        # The entity factory always appends the guild ID for the @everyone role.
+        member = mock.Mock(
+            role_ids=[
+                snowflakes.Snowflake(1),
+                snowflakes.Snowflake(2),
+                snowflakes.Snowflake(3),
+                snowflakes.Snowflake(123),
+            ]
+        )
+        rest_client.fetch_member = mock.AsyncMock(return_value=member)
+        rest_client.edit_member = mock.AsyncMock()
+
+        result = await rest_client.set_member_roles(
+            StubModel(123),
+            StubModel(456),
+            add=[StubModel(4), 1, 5],
+            remove=[StubModel(2), 5, 6],
+            reason="because i can",
+        )
+
+        assert result is rest_client.edit_member.return_value
+        rest_client.fetch_member.assert_awaited_once_with(StubModel(123), StubModel(456))
+        rest_client.edit_member.assert_awaited_once_with(
+            StubModel(123), StubModel(456), roles=[1, 3, 4], reason="because i can"
+        )
+        assert 123 not in rest_client.edit_member.call_args.kwargs["roles"]
+
+    @pytest.mark.parametrize(("add", "remove"), [((), ()), ([StubModel(1), 2], [3]), ([123], ()), ((), [123])])
+    async def test_set_member_roles_without_changes(self, rest_client, add, remove):
+        member = mock.Mock(role_ids=[snowflakes.Snowflake(1), snowflakes.Snowflake(2), snowflakes.Snowflake(123)])
+        rest_client.fetch_member = mock.AsyncMock(return_value=member)
+        rest_client.edit_member = mock.AsyncMock()
+
+        assert await rest_client.set_member_roles(StubModel(123), StubModel(456), add=add, remove=remove) is member
+
+        rest_client.edit_member.assert_not_called()
+
     async def test_kick_user(self, rest_client):
         expected_route = routes.DELETE_GUILD_MEMBER.compile(guild=123, user=456)
         rest_client._request = mock.AsyncMock()
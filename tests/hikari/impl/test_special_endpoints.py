@@ -20,6 +20,7 @@
 # SOFTWARE.
 from __future__ import annotations
 
+import asyncio
 import typing
 
 import mock
@@ -515,6 +516,100 @@ async def test_aiter_when_empty_chunk(self, newest_first: bool):
         mock_request.assert_awaited_once_with(compiled_route=expected_route, query=query)
 
 
+class TestAuditLogIterator:
+    @pytest.mark.parametrize("prefetch", [True, False])
+    @pytest.mark.asyncio
+    async def test_aiter(self, prefetch: bool):
+        expected_route = routes.GET_GUILD_AUDIT_LOGS.compile(guild=10000)
+        mock_entity_factory = mock.Mock()
+        mock_payload_1 = {"audit_log_entries": [{"id": "5432"}, {"id": "1234"}]}
+        mock_payload_2 = {"audit_log_entries": [{"id": "1000"}]}
+        mock_result_1 = mock.Mock()
+        mock_result_2 = mock.Mock()
+        mock_entity_factory.deserialize_audit_log.side_effect = [mock_result_1, mock_result_2]
+        mock_request = mock.AsyncMock(side_effect=[mock_payload_1, mock_payload_2, {"audit_log_entries": []}])
+        iterator = special_endpoints.AuditLogIterator(
+            entity_factory=mock_entity_factory,
+            request_call=mock_request,
+            guild=10000,
+            before=undefined.UNDEFINED,
+            user=undefined.UNDEFINED,
+            action_type=undefined.UNDEFINED,
+            prefetch=prefetch,
+        )
+
+        result = await iterator
+
+        assert result == [mock_result_1, mock_result_2]
+        mock_entity_factory.deserialize_audit_log.assert_has_calls(
+            [mock.call(mock_payload_1, guild_id=10000), mock.call(mock_payload_2, guild_id=10000)]
+        )
+        mock_request.assert_has_awaits(
+            [
+                mock.call(compiled_route=expected_route, query={"limit": "100"}),
+                mock.call(compiled_route=expected_route, query={"limit": "100", "before": "1234"}),
+                mock.call(compiled_route=expected_route, query={"limit": "100", "before": "1000"}),
+            ]
+        )
+
+    @pytest.mark.asyncio
+    async def test_aiter_when_empty_page(self):
+        expected_route = routes.GET_GUILD_AUDIT_LOGS.compile(guild=10000)
+        mock_entity_factory = mock.Mock()
+        mock_request = mock.AsyncMock(return_value={"audit_log_entries": []})
+        iterator = special_endpoints.AuditLogIterator(
+            entity_factory=mock_entity_factory,
+            request_call=mock_request,
+            guild=10000,
+            before="54234123123",
+            user=123,
+            action_type=1,
+            prefetch=True,
+        )
+
+        result = await iterator
+
+        assert result == []
+        mock_entity_factory.deserialize_audit_log.assert_not_called()
+        mock_request.assert_awaited_once_with(
+            compiled_route=expected_route,
+            query={"limit": "100", "user_id": "123", "action_type": "1", "before": "54234123123"},
+        )
+
+    @pytest.mark.asyncio
+    async def test_aclose_cancels_prefetched_page(self):
+        mock_entity_factory = mock.Mock()
+        second_page_requested = asyncio.Event()
+
+        async def request_call(compiled_route, query):
+            if "before" in query:
+                second_page_requested.set()
+                await asyncio.Event().wait()
+
+            return {"audit_log_entries": [{"id": "5432"}]}
+
+        iterator = special_endpoints.AuditLogIterator(
+            entity_factory=mock_entity_factory,
+            request_call=request_call,
+            guild=10000,
+            before=undefined.UNDEFINED,
+            user=undefined.UNDEFINED,
+            action_type=undefined.UNDEFINED,
+            prefetch=True,
+        )
+
+        assert await iterator.__anext__() is mock_entity_factory.deserialize_audit_log.return_value
+        await second_page_requested.wait()
+        prefetch_task = iterator._prefetch_task
+
+        await iterator.aclose()
+        await asyncio.sleep(0)
+
+        assert prefetch_task is not None
+        assert prefetch_task.cancelled()
+        assert [entry async for entry in iterator] == []
+
+
 @pytest.mark.asyncio
 class TestGuildThreadIterator:
     @pytest.mark.parametrize("before_is_timestamp", [True, False])
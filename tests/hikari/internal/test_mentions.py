@@ -51,3 +51,21 @@ def test_generate_allowed_mentions(function_input, expected_output):
             expected_output[k] = sorted(expected_output[k])
 
     assert returned == expected_output
+
+
+@pytest.mark.parametrize("index", [2, 3])
+def test_generate_allowed_mentions_when_too_many_unique_mentions(index):
+    function_input = [False, False, [], []]
+    function_input[index] = range(101)
+
+    with pytest.raises(ValueError, match=r"Cannot allow more than 100 unique (user|role)_mentions"):
+        mentions.generate_allowed_mentions(*function_input)
+
+
+def test_generate_allowed_mentions_when_duplicates_bring_mentions_within_limit():
+    user_mentions = [*range(100), *(str(i) for i in range(100))]
+
+    returned = mentions.generate_allowed_mentions(False, False, user_mentions, frozenset(range(100)))
+
+    assert sorted(returned["users"]) == sorted(str(i) for i in range(100))
+    assert sorted(returned["roles"]) == sorted(str(i) for i in range(100))
@@ -27,6 +27,7 @@
 import pytest
 
 from hikari import errors
+from hikari.impl import config
 from hikari.internal import net
 
 
@@ -178,3 +179,39 @@ async def read(self):
 
     error.assert_called_once_with("https://some.url", {}, data, "raw message", 123, errors=expected_errors)
     assert returned is error()
+
+
+@pytest.mark.parametrize(("force_close", "expected_keepalive_timeout"), [(True, None), (False, 30.5)])
+def test_create_tcp_connector(force_close, expected_keepalive_timeout):
+    http_settings = config.HTTPSettings(
+        enable_cleanup_closed=True,
+        force_close_transports=force_close,
+        connection_limit=50,
+        connection_limit_per_host=20,
+        keepalive_timeout=30.5,
+    )
+
+    with mock.patch.object(aiohttp, "TCPConnector") as tcp_connector:
+        assert net.create_tcp_connector(http_settings, dns_cache=20) is tcp_connector.return_value
+
+    tcp_connector.assert_called_once_with(
+        enable_cleanup_closed=True,
+        force_close=force_close,
+        keepalive_timeout=expected_keepalive_timeout,
+        limit=50,
+        limit_per_host=20,
+        ssl=http_settings.ssl,
+        ttl_dns_cache=20,
+        use_dns_cache=True,
+    )
+
+
+@pytest.mark.parametrize(("dns_cache", "expected_ttl"), [(True, 300), (None, None), (20, 20)])
+def test_create_tcp_connector_dns_cache_ttl(dns_cache, expected_ttl):
+    http_settings = config.HTTPSettings(dns_cache_ttl=300)
+
+    with mock.patch.object(aiohttp, "TCPConnector") as tcp_connector:
+        net.create_tcp_connector(http_settings, dns_cache=dns_cache)
+
+    assert tcp_connector.call_args.kwargs["ttl_dns_cache"] == expected_ttl
+    assert tcp_connector.call_args.kwargs["use_dns_cache"] is True
@@ -21,6 +21,9 @@
 from __future__ import annotations
 
 import datetime
+import os
+import random
+import time as time_
 
 import mock
 import pytest
@@ -113,14 +116,43 @@ def test_parse_discord_epoch_to_datetime():
     assert time.discord_epoch_to_datetime(discord_timestamp) == expected_timestamp
 
 
-def test_parse_datetime_to_discord_epoch():
-    # This specific timestamp (amongst others) has given problems in the past with
-    # float precision, so make sure it doesn't happen again.
-    timestamp = datetime.datetime(2022, 8, 13, 23, 10, 35, 843000, tzinfo=datetime.timezone.utc)
-    expected_discord_timestamp = 240361835843
+@pytest.mark.parametrize(
+    ("timestamp", "expected_discord_timestamp"),
+    [
+        # These specific timestamps (amongst others) have given problems in the past with
+        # float precision, so make sure it doesn't happen again.
+        (datetime.datetime(2022, 8, 13, 23, 10, 35, 843000, tzinfo=datetime.timezone.utc), 240361835843),
+        (datetime.datetime(2023, 7, 18, 1, 13, 12, 275000, tzinfo=datetime.timezone.utc), 269572392275),
+        (datetime.datetime(2038, 11, 2, 22, 43, 46, 864000, tzinfo=datetime.timezone.utc), 752280226864),
+    ],
+)
+def test_parse_datetime_to_discord_epoch(timestamp: datetime.datetime, expected_discord_timestamp: int):
     assert time.datetime_to_discord_epoch(timestamp) == expected_discord_timestamp
 
 
+def test_parse_naive_datetime_to_discord_epoch():
+    timestamp = datetime.datetime(2022, 8, 13, 23, 10, 35, 843000)
+
+    assert time.datetime_to_discord_epoch(timestamp) == time.datetime_to_discord_epoch(timestamp.astimezone())
+
+
+@pytest.mark.skipif(not hasattr(time_, "tzset"), reason="time.tzset is only available on Unix")
+def test_parse_naive_datetime_to_discord_epoch_on_non_utc_host():
+    # Naive datetimes are local time, as with datetime.timestamp. "ABC+5" is UTC-05:00 without DST.
+    timestamp = datetime.datetime(2022, 8, 13, 23, 10, 35, 843000)
+
+    try:
+        with mock.patch.dict(os.environ, {"TZ": "ABC+5"}):
+            time_.tzset()
+            result = time.datetime_to_discord_epoch(timestamp)
+            from_timestamp = int(timestamp.timestamp() * 1_000) - 1_420_070_400_000
+    finally:
+        time_.tzset()
+
+    assert result == 240379835843
+    assert result == from_timestamp
+
+
 def test_parse_unix_epoch_to_datetime():
     unix_timestamp = 1457991678956
     expected_timestamp = datetime.datetime(2016, 3, 14, 21, 41, 18, 956000, tzinfo=datetime.timezone.utc)
@@ -184,3 +216,11 @@ class datetime:
     datetime_module.datetime.now.assert_called_once_with(tz=datetime.timezone.utc)
 
     assert result == current_datetime.astimezone()
+
+
+def test_fixed_size_nonce():
+    with (
+        mock.patch.object(time, "time_ns", return_value=1750363933884138616),
+        mock.patch.object(random, "getrandbits", return_value=3816720724214628891853616180),
+    ):
+        assert time.fixed_size_nonce() == "GEqKuVrRxHgMVR4NDFaqlnpIdDQ="
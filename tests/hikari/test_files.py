@@ -59,6 +59,49 @@ def test___exit__(self, reader):
             pytest.fail(exc)
 
 
+class TestAsyncReader:
+    @pytest.mark.parametrize(
+        "chunks", [[b"\211PNG\r\n\032\nhello world"], [b"\211PN", b"G\r\n\032", b"\nhel", b"lo w", b"orld"]]
+    )
+    @pytest.mark.asyncio
+    async def test_data_uri(self, chunks):
+        reader = files.IteratorReader(filename="image.png", mimetype=None, data=chunks)
+
+        assert await reader.data_uri() == files.to_data_uri(b"\211PNG\r\n\032\nhello world", "image/png")
+
+    @pytest.mark.parametrize("chunk_size", [1, 2, 4, 5])
+    @pytest.mark.parametrize("mimetype", [None, "image/gif"])
+    @pytest.mark.asyncio
+    async def test_data_uri_when_chunks_not_aligned(self, chunk_size: int, mimetype: str | None):
+        data = b"\211PNG\r\n\032\nhello world, this is a png"
+        chunks = [data[i : i + chunk_size] for i in range(0, len(data), chunk_size)]
+        reader = files.IteratorReader(filename="image.png", mimetype=mimetype, data=chunks)
+
+        assert await reader.data_uri() == files.to_data_uri(data, mimetype)
+
+    @pytest.mark.parametrize("chunks", [[b"\211PNG\r\n\032\nab"], [b"\211PNG\r", b"\n\032", b"", b"\nab"]])
+    @pytest.mark.asyncio
+    async def test_data_uri_when_shorter_than_mimetype_header(self, chunks: list[bytes]):
+        data = b"\211PNG\r\n\032\nab"
+        assert len(data) < files._MIMETYPE_HEADER_SIZE
+        reader = files.IteratorReader(filename="image.png", mimetype=None, data=chunks)
+
+        assert await reader.data_uri() == files.to_data_uri(data, None)
+
+    @pytest.mark.asyncio
+    async def test_data_uri_when_mimetype_provided(self):
+        reader = files.IteratorReader(filename="image.png", mimetype="image/gif", data=[b"a", b"bcde", b"f"])
+
+        assert await reader.data_uri() == "data:image/gif;base64,YWJjZGVm"
+
+    @pytest.mark.asyncio
+    async def test_data_uri_when_mimetype_cannot_be_guessed(self):
+        reader = files.IteratorReader(filename="image.png", mimetype=None, data=[b"abc"])
+
+        with pytest.raises(TypeError, match="Cannot infer mimetype from input data, specify it manually."):
+            await reader.data_uri()
+
+
 def test__open_read_path():
     expanded_path = mock.Mock()
     path = mock.Mock(expanduser=mock.Mock(return_value=expanded_path))
@@ -20,6 +20,10 @@
 # SOFTWARE.
 from __future__ import annotations
 
+import asyncio
+import typing
+
+import mock
 import pytest
 
 from hikari import iterators
@@ -40,3 +44,146 @@ async def test_flatten(self):
         iterator = iterators.FlatLazyIterator([[123, 321, 4352, 123], [], [12343123, 4234432], [543123123]])
 
         assert await iterator.flatten() == [123, 321, 4352, 123, 12343123, 4234432, 543123123]
+
+
+class _ChunkedIterator(iterators.BufferedLazyIterator[int]):
+    def __init__(self, chunks: list[list[int]], *, prefetch: bool) -> None:
+        super().__init__(prefetch=prefetch)
+        self.chunks = chunks
+        self.requested = 0
+
+    async def _next_chunk(self) -> typing.Generator[int, None, None] | None:
+        if self.requested == len(self.chunks):
+            return None
+
+        chunk = self.chunks[self.requested]
+        await asyncio.sleep(0)
+        self.requested += 1
+        return (i for i in chunk)
+
+
+class TestBufferedLazyIterator:
+    @pytest.mark.asyncio
+    async def test_without_prefetch(self):
+        iterator = _ChunkedIterator([[1, 2], [3]], prefetch=False)
+
+        assert await iterator.__anext__() == 1
+        await asyncio.sleep(0.01)
+        assert iterator.requested == 1
+        assert [i async for i in iterator] == [2, 3]
+
+    @pytest.mark.asyncio
+    async def test_with_prefetch(self):
+        iterator = _ChunkedIterator([[1, 2], [3]], prefetch=True)
+
+        assert await iterator.__anext__() == 1
+        await asyncio.sleep(0.01)
+        assert iterator.requested == 2
+        assert [i async for i in iterator] == [2, 3]
+        assert iterator._prefetch_task is None
+
+    @pytest.mark.asyncio
+    async def test_with_prefetch_when_next_chunk_raises(self):
+        iterator = _ChunkedIterator([[1]], prefetch=True)
+        error = RuntimeError("ded")
+        iterator._next_chunk = mock.AsyncMock(side_effect=[(i for i in (1,)), error])
+
+        assert await iterator.__anext__() == 1
+
+        with pytest.raises(RuntimeError) as exc_info:
+            await iterator.__anext__()
+
+        assert exc_info.value is error
+        assert iterator._prefetch_task is None
+
+    @pytest.mark.asyncio
+    async def test_aclose_cancels_prefetch(self):
+        iterator = _ChunkedIterator([[1], [2]], prefetch=True)
+        blocker = asyncio.Event()
+
+        assert await iterator.__anext__() == 1
+
+        async def next_chunk():
+            await blocker.wait()
+
+        prefetch_task = iterator._prefetch_task = asyncio.create_task(next_chunk())
+
+        await iterator.aclose()
+        await asyncio.sleep(0)
+
+        assert prefetch_task.cancelled()
+        assert iterator._prefetch_task is None
+        assert [i async for i in iterator] == []
+
+    @pytest.mark.asyncio
+    async def test_aclose_without_prefetch(self):
+        iterator = _ChunkedIterator([[1, 2], [3]], prefetch=False)
+
+        assert await iterator.__anext__() == 1
+        await iterator.aclose()
+
+        assert [i async for i in iterator] == []
+        assert await iterator == []
+        assert iterator.requested == 1
+
+    @pytest.mark.asyncio
+    async def test_limit_leaves_wrapped_iterator_reusable(self):
+        iterator = _ChunkedIterator([[1, 2], [3, 4]], prefetch=False)
+
+        assert [i async for i in iterator.limit(1)] == [1]
+        assert [i async for i in iterator.limit(2)] == [2, 3]
+        assert [i async for i in iterator] == [4]
+        assert iterator.requested == 2
+
+    @pytest.mark.asyncio
+    async def test_limit_cancels_pending_prefetch(self):
+        iterator = _ChunkedIterator([[1, 2], [3]], prefetch=True)
+
+        assert [i async for i in iterator.limit(2)] == [1, 2]
+        prefetch_task = iterator._prefetch_task
+        await asyncio.sleep(0)
+
+        assert prefetch_task is None or prefetch_task.cancelled()
+        assert iterator._prefetch_task is None
+        assert iterator.requested == 1
+        assert [i async for i in iterator] == [3]
+
+    @pytest.mark.asyncio
+    async def test_limit_keeps_finished_prefetch(self):
+        iterator = _ChunkedIterator([[1, 2], [3]], prefetch=True)
+        limited = iterator.limit(2)
+
+        assert await limited.__anext__() == 1
+        await asyncio.sleep(0.01)
+        prefetch_task = iterator._prefetch_task
+        assert [i async for i in limited] == [2]
+
+        assert iterator._prefetch_task is prefetch_task
+        assert [i async for i in iterator] == [3]
+        assert iterator.requested == 2
+
+    @pytest.mark.asyncio
+    async def test_aclose_on_wrapping_iterator(self):
+        iterator = _ChunkedIterator([[1, 2], [3]], prefetch=False)
+        wrapper = iterator.map(lambda i: i * 2).filter(lambda i: i > 0)
+
+        assert await wrapper.__anext__() == 2
+        await wrapper.aclose()
+
+        assert [i async for i in iterator] == []
+
+    @pytest.mark.parametrize("prefetch", [True, False])
+    @pytest.mark.asyncio
+    async def test_await(self, prefetch: bool):
+        iterator = _ChunkedIterator([[1, 2], [3], [4, 5, 6]], prefetch=prefetch)
+
+        assert await iterator == [1, 2, 3, 4, 5, 6]
+        assert iterator.requested == 3
+
+    @pytest.mark.asyncio
+    async def test_await_when_partially_consumed(self):
+        iterator = _ChunkedIterator([[1, 2], [3]], prefetch=False)
+
+        assert await iterator.__anext__() == 1
+        assert await iterator == [2, 3]
+        assert await iterator == []